@@ -1,225 +1,134 @@
+import json
+from pathlib import Path
 
 import streamlit as st
-from streamlit_option_menu import option_menu
-import base64
-from main import LedgerlyApp
+import streamlit.components.v1 as components
 
-def load_css():
-    """Load and inject custom CSS with theme support"""
-    return """
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    /* Base Variables */
-    :root {
-        --primary-color: #6366f1;
-        --secondary-color: #8b5cf6;
-        --accent-color: #06b6d4;
-        --text-primary: #1f2937;
-        --text-secondary: #6b7280;
-        --bg-primary: #ffffff;
-        --bg-secondary: #f8fafc;
-        --border-color: #e5e7eb;
-        --shadow: 0 1px 3px 0 rgba(0, 0, 0, 0.1);
-    }
-    
-    .dark-theme {
-        --primary-color: #8b5cf6;
-        --secondary-color: #6366f1;
-        --accent-color: #06b6d4;
-        --text-primary: #f9fafb;
-        --text-secondary: #d1d5db;
-        --bg-primary: #111827;
-        --bg-secondary: #1f2937;
-        --border-color: #374151;
-        --shadow: 0 1px 3px 0 rgba(0, 0, 0, 0.3);
-    }
-    
-    /* Animated Gradient Background */
-    .main-container {
-        background: linear-gradient(-45deg, #6366f1, #8b5cf6, #06b6d4, #3b82f6);
-        background-size: 400% 400%;
-        animation: gradientShift 10s ease infinite;
-        min-height: 100vh;
-        position: relative;
-    }
-    
-    .dark-theme .main-container {
-        background: linear-gradient(-45deg, #1e1b4b, #312e81, #1e3a8a, #1e40af);
-        background-size: 400% 400%;
-        animation: gradientShift 10s ease infinite;
-    }
-    
-    @keyframes gradientShift {
-        0% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-        100% { background-position: 0% 50%; }
-    }
-    
-    /* Theme Toggle Button */
-    .theme-toggle {
-        position: fixed;
-        top: 20px;
-        right: 20px;
-        z-index: 1000;
-        background: var(--bg-primary);
-        border: 2px solid var(--border-color);
-        border-radius: 50px;
-        padding: 8px 16px;
-        cursor: pointer;
-        box-shadow: var(--shadow);
-        transition: all 0.3s ease;
-        font-size: 18px;
-        color: var(--text-primary);
-    }
-    
-    .theme-toggle:hover {
-        transform: scale(1.05);
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);
-    }
-    
-    /* Content Overlay */
-    .content-overlay {
-        background: rgba(255, 255, 255, 0.95);
-        backdrop-filter: blur(10px);
-        border-radius: 20px;
-        margin: 20px;
-        padding: 30px;
-        box-shadow: 0 8px 32px rgba(31, 38, 135, 0.37);
-        border: 1px solid rgba(255, 255, 255, 0.18);
-        min-height: calc(100vh - 40px);
-    }
-    
-    .dark-theme .content-overlay {
-        background: rgba(31, 41, 55, 0.95);
-        border: 1px solid rgba(107, 114, 128, 0.18);
-    }
-    
-    /* Streamlit Customizations */
-    .stApp {
-        font-family: 'Inter', sans-serif;
-    }
-    
-    .main .block-container {
-        padding: 0;
-        max-width: none;
-    }
-    
-    /* Sidebar Styling */
-    .css-1d391kg {
-        background: var(--bg-secondary);
-        border-right: 1px solid var(--border-color);
-    }
-    
-    /* Metrics Cards */
-    .metric-card {
-        background: var(--bg-primary);
-        padding: 20px;
-        border-radius: 12px;
-        border: 1px solid var(--border-color);
-        box-shadow: var(--shadow);
-        text-align: center;
-        transition: transform 0.2s ease, box-shadow 0.2s ease;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-    }
-    
-    /* Form Styling */
-    .stTextInput > div > div > input,
-    .stNumberInput > div > div > input,
-    .stSelectbox > div > div > select,
-    .stTextArea > div > div > textarea {
-        border-radius: 8px !important;
-        border: 2px solid var(--border-color) !important;
-        background: var(--bg-primary) !important;
-        color: var(--text-primary) !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .stTextInput > div > div > input:focus,
-    .stNumberInput > div > div > input:focus,
-    .stSelectbox > div > div > select:focus,
-    .stTextArea > div > div > textarea:focus {
-        border-color: var(--primary-color) !important;
-        box-shadow: 0 0 0 3px rgba(99, 102, 241, 0.1) !important;
-    }
-    
-    /* Button Styling */
-    .stButton > button {
-        background: linear-gradient(135deg, var(--primary-color), var(--secondary-color)) !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 8px !important;
-        padding: 12px 24px !important;
-        font-weight: 500 !important;
-        transition: all 0.3s ease !important;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1) !important;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-1px) !important;
-        box-shadow: 0 4px 12px rgba(99, 102, 241, 0.3) !important;
-    }
-    
-    /* Dataframe Styling */
-    .stDataFrame {
-        border-radius: 12px !important;
-        overflow: hidden !important;
-        box-shadow: var(--shadow) !important;
-    }
-    
-    /* Alert Styling */
-    .stAlert {
-        border-radius: 8px !important;
-        border: none !important;
-        box-shadow: var(--shadow) !important;
-    }
-    
-    /* Animation Classes */
-    .fade-in {
-        animation: fadeIn 0.6s ease-in;
-    }
-    
-    @keyframes fadeIn {
-        from { opacity: 0; transform: translateY(20px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-    
-    .slide-up {
-        animation: slideUp 0.4s ease-out;
-    }
-    
-    @keyframes slideUp {
-        from { transform: translateY(30px); opacity: 0; }
-        to { transform: translateY(0); opacity: 1; }
-    }
-    
-    /* Responsive Design */
-    @media (max-width: 768px) {
-        .content-overlay {
-            margin: 10px;
-            padding: 20px;
-            border-radius: 15px;
-        }
-        
-        .theme-toggle {
-            top: 10px;
-            right: 10px;
-            padding: 6px 12px;
-            font-size: 16px;
-        }
-    }
-    
-    /* Hide Streamlit Branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    .stDeployButton {display:none;}
-    </style>
+from ui_utils import minify_css
+
+STATIC_DIR = Path(__file__).parent / "static"
+FONT_CSS_URL = "https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap"
+
+@st.cache_data
+def load_css() -> str:
+    """Return the app shell theme as ``<style>`` elements, plus the font links.
+
+    The CSS lives in ``static/`` but is inlined rather than linked: Streamlit's
+    static file server sends ``.css`` as ``text/plain`` with ``nosniff``, which
+    browsers refuse as a stylesheet. It is read and minified once per process
+    and written into the parent ``<head>`` once per session (see
+    ``inject_shell``), so reruns never resend it. The dark variables only apply under
+    ``prefers-color-scheme: dark``, so first paint follows the OS theme
+    without any Python involvement; an explicit toggle overrides the media
+    query in the browser.
+
+    The Inter font is linked directly (with preconnects) rather than through
+    a CSS ``@import``, so its fetch starts before the theme is parsed.
     """
+    def style(name: str, media: str = "") -> str:
+        css = minify_css((STATIC_DIR / f"{name}.css").read_text(encoding="utf-8"))
+        media_attr = f' media="{media}"' if media else ""
+        return f'<style id="ledgerly-{name}"{media_attr}>{css}</style>'
+
+    return (
+        '<link rel="preconnect" href="https://fonts.googleapis.com">'
+        '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+        f'<link rel="stylesheet" href="{FONT_CSS_URL}">'
+        + style("theme")
+        + style("theme-light")
+        + style("theme-dark", media="(prefers-color-scheme: dark)")
+    )
+
+# Theme toggle handled entirely in the browser: a fixed-position button that
+# forces the dark variables sheet on or off and remembers the choice in
+# localStorage, so switching themes never re-executes the Python script.
+# Without a stored choice the OS preference (the sheet's media query) rules.
+THEME_TOGGLE_JS = """
+(() => {
+    const svg = (body) => '<svg width="18" height="18" viewBox="0 0 24 24" fill="none"'
+        + ' stroke="currentColor" stroke-width="2" stroke-linecap="round" aria-hidden="true">'
+        + body + '</svg>';
+    const MOON = svg('<path d="M21 12.8A9 9 0 1 1 11.2 3a7 7 0 0 0 9.8 9.8z"/>');
+    const SUN = svg('<circle cx="12" cy="12" r="4"/><path d="M12 2v2M12 20v2M4.9 4.9l1.4 1.4'
+        + 'M17.7 17.7l1.4 1.4M2 12h2M20 12h2M4.9 19.1l1.4-1.4M17.7 6.3l1.4-1.4"/>');
+    const btn = document.createElement("button");
+    btn.className = "theme-toggle";
+    btn.title = "Toggle theme";
+    const dark = document.getElementById("ledgerly-theme-dark");
+    function applyTheme(theme) {
+        dark.media = theme === "dark" ? "all" : "not all";
+        btn.innerHTML = theme === "dark" ? SUN : MOON;
+    }
+    let theme = localStorage.getItem("ledgerly-theme");
+    if (theme) {
+        applyTheme(theme);
+    } else {
+        theme = matchMedia("(prefers-color-scheme: dark)").matches ? "dark" : "light";
+        btn.innerHTML = theme === "dark" ? SUN : MOON;
+    }
+    btn.addEventListener("click", () => {
+        theme = theme === "dark" ? "light" : "dark";
+        localStorage.setItem("ledgerly-theme", theme);
+        applyTheme(theme);
+    });
+    document.body.appendChild(btn);
+})();
+"""
+
+# Appends the theme styles and the theme toggle to the parent document.
+# Nodes there are not owned by Streamlit, so they survive reruns that no
+# longer emit this component. The toggle is added as a <script> element so it
+# runs in the parent window rather than in this short-lived iframe, right
+# after the styles are inserted and before the first style recalculation.
+SHELL_INJECT_HTML = """
+<script>
+    const doc = window.parent.document;
+    if (!doc.getElementById("ledgerly-head")) {
+        doc.head.insertAdjacentHTML("beforeend", '<meta id="ledgerly-head">' + __HEAD__);
+        const toggle = doc.createElement("script");
+        toggle.textContent = __TOGGLE_JS__;
+        doc.head.appendChild(toggle);
+    }
+</script>
+"""
+
+def inject_shell() -> None:
+    """Inject the theme stylesheets and toggle once per session, not every rerun."""
+    if st.session_state.get("_shell_injected"):
+        return
+    components.html(
+        SHELL_INJECT_HTML
+        .replace("__HEAD__", json.dumps(load_css()))
+        .replace("__TOGGLE_JS__", json.dumps(THEME_TOGGLE_JS)),
+        height=0,
+    )
+    st.session_state._shell_injected = True
+
+# Placeholder layout (header + KPI row + two panels) painted on the first run
+# of a session while the dashboard and its imports load.
+SKELETON_HTML = """
+<div class="skeleton-page">
+    <div class="skeleton skeleton-header"></div>
+    <div class="skeleton-row">
+        <div class="skeleton skeleton-card"></div><div class="skeleton skeleton-card"></div>
+        <div class="skeleton skeleton-card"></div><div class="skeleton skeleton-card"></div>
+    </div>
+    <div class="skeleton-row">
+        <div class="skeleton skeleton-panel"></div><div class="skeleton skeleton-panel"></div>
+    </div>
+</div>
+"""
+
+def get_ledgerly_app():
+    """Build the LedgerlyApp; its Dashboard and DB setup are cached in main.
+
+    The import happens here so the styled shell is sent before the dashboard's
+    pandas/plotly/SQLAlchemy imports are paid for. The app itself is built per
+    run so a database error is reported via st.error on every rerun rather
+    than only inside a cached call.
+    """
+    from main import LedgerlyApp
+    return LedgerlyApp()
 
 def main():
     st.set_page_config(
@@ -229,36 +138,19 @@ def main():
         initial_sidebar_state="expanded"
     )
     
-    # Initialize theme in session state
-    if 'theme' not in st.session_state:
-        st.session_state.theme = 'light'
-    
-    # Load CSS
-    st.markdown(load_css(), unsafe_allow_html=True)
-    
-    # Theme toggle
-    col1, col2 = st.columns([10, 1])
-    with col2:
-        theme_icon = "🌙" if st.session_state.theme == 'light' else "🌞"
-        if st.button(theme_icon, key="theme_toggle", help="Toggle theme"):
-            st.session_state.theme = 'dark' if st.session_state.theme == 'light' else 'light'
-            st.rerun()
-    
-    # Apply theme class
-    theme_class = "dark-theme" if st.session_state.theme == 'dark' else ""
+    first_run = not st.session_state.get("_shell_injected")
+
+    # Load CSS and the theme toggle
+    inject_shell()
     
-    # Main container with animated gradient
-    st.markdown(f"""
-        <div class="main-container {theme_class}">
-            <div class="content-overlay fade-in">
-    """, unsafe_allow_html=True)
+    # Paint the skeleton first so the styled shell shows up immediately; later
+    # reruns draw straight over the previous page instead of flashing it.
+    shell = st.empty()
+    if first_run:
+        shell.html(SKELETON_HTML)
     
     # Initialize and run app
-    app = LedgerlyApp()
-    app.run()
-    
-    # Close container
-    st.markdown("</div></div>", unsafe_allow_html=True)
+    get_ledgerly_app().run(shell.container())
 
 if __name__ == "__main__":
     main()
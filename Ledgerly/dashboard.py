@@ -4,17 +4,17 @@
 #
 # This dashboard focuses on a refined, production-friendly UI / UX:
 #   - Glassmorphism (frosted) surfaces + animated gradient background
-#   - Light / Dark theme toggle with live CSS variable updates
+#   - Light / Dark theme driven by the app shell's browser-side toggle
 #   - Micro-interactions (hover, press, slide, fade) and accent shadows
 #   - Flexible CSV/Excel import (auto-map headers, soft validation)
 #   - Subtle motion on KPI cards, buttons, and section transitions
-#   - Non-blocking row-level error handling for imports
+#   - All-or-nothing imports: each file commits or rolls back as one transaction
 #   - Zero changes to your service layer contracts
 #
 # It preserves your original functional surface:
 #   Pages: Dashboard • Sales • Inventory • Expenses • Reports • Settings
 #   Services: BillingService, StockService, AnalyticsService, ReminderService
-#   Utils: format_currency, parse_date, CURRENCY_SYMBOL
+#   Utils: format_currency, parse_date
 #
 # Drop-in replacement: keep your project structure identical and replace
 # only this file. No extra libraries required beyond your requirements.txt.
@@ -25,20 +25,386 @@ from __future__ import annotations
 import io
 import json
 import datetime
-from typing import Dict, Iterable, List, Optional, Tuple
+from html import escape
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import pyarrow as pa
 import streamlit as st
+import streamlit.components.v1 as components
+from streamlit.runtime.uploaded_file_manager import UploadedFile
 
 # Project services / utils
 from ledgerly.services.billing_service import BillingService
 from ledgerly.services.stock_service import StockService
-from ledgerly.services.analytics_service import AnalyticsService
+from ledgerly.services.analytics_service import AnalyticsService, clear_analytics_cache
 from ledgerly.services.reminder_service import ReminderService
-from ledgerly.utils.helpers import format_currency, parse_date
-from ledgerly.utils.config import CURRENCY_SYMBOL
+from ledgerly.utils.helpers import format_currency, format_currency_many, parse_date
+from ui_utils import minify_css
+
+if TYPE_CHECKING:
+    # Plotly is imported where charts are built: its import is slow and only
+    # the Reports page needs it
+    import plotly.graph_objects as go
+
+
+# ============================== Theming ============================== #
+# Only the accent palette lives here, constant across themes for brand
+# recognition. Theme-dependent colours (text, borders, card surfaces) come
+# from the shell's static/theme-light.css / theme-dark.css, which app.py's
+# toggle switches, so the dashboard never fights the shell over them.
+_ACCENT_TOKENS: Dict[str, str] = {
+    "ring_color": "rgba(59,130,246,0.35)",  # focus ring
+    "accent_1": "#6366F1",  # indigo
+    "accent_2": "#06B6D4",  # cyan
+    "accent_3": "#10B981",  # emerald
+    "accent_4": "#F59E0B",  # amber
+    "accent_danger": "#EF4444",
+}
+
+# Global CSS: animated gradient, frosted cards, micro-UX
+_CSS_TEMPLATE = """
+:root {{
+    --ring: {ring_color};
+    --accent-1: {accent_1};
+    --accent-2: {accent_2};
+    --accent-3: {accent_3};
+    --accent-4: {accent_4};
+    --accent-danger: {accent_danger};
+}}
+
+/* App background with animated gradient */
+.stApp {{
+    background: radial-gradient(1200px 600px at 20% 10%, rgba(99,102,241,0.22), transparent 60%),
+                radial-gradient(1200px 600px at 80% 0%, rgba(6,182,212,0.18), transparent 60%),
+                linear-gradient(135deg, #0f172a 0%, #1e293b 40%, #0b1020 100%);
+    background-size: 180% 180%;
+    animation: bgShift 24s ease-in-out infinite alternate;
+}}
+@keyframes bgShift {{
+    0% {{ background-position: 0% 20%, 100% 0%, 0% 0%; }}
+    50% {{ background-position: 50% 40%, 50% 50%, 50% 50%; }}
+    100% {{ background-position: 100% 20%, 0% 0%, 100% 100%; }}
+}}
+
+/* Glass card container */
+.glass {{
+    background: var(--card-bg);
+    border: 1px solid var(--border-color);
+    border-radius: 18px;
+    box-shadow: var(--card-shadow);
+    -webkit-backdrop-filter: saturate(140%) blur(14px);
+    backdrop-filter: saturate(140%) blur(14px);
+    padding: 18px 18px;
+    transition: transform .24s ease, box-shadow .24s ease, border-color .2s ease;
+}}
+.glass:hover {{
+    transform: translateY(-3px);
+    box-shadow: 0 24px 48px rgba(0,0,0,0.3);
+    border-color: rgba(99,102,241,0.45);
+}}
+
+/* KPI row: the four metric cards as one grid */
+.kpi-row {{
+    display: grid;
+    grid-template-columns: repeat(4, minmax(0, 1fr));
+    gap: 1rem;
+    margin-bottom: 1rem;
+}}
+@media (max-width: 640px) {{
+    .kpi-row {{ grid-template-columns: 1fr; }}
+}}
+
+/* Soft section container */
+.soft {{
+    background: var(--subtle-bg);
+    border-radius: 14px;
+    border: 1px dashed rgba(125,125,125,0.16);
+    padding: 16px 16px;
+}}
+
+/* Metric card with shimmer underline */
+.metric {{
+    position: relative;
+    overflow: hidden;
+}}
+.metric h3 {{
+    margin: 0;
+    color: var(--text-secondary);
+    font-size: 13.5px;
+    letter-spacing: .2px;
+    text-transform: uppercase;
+}}
+.metric .value {{
+    font-weight: 800;
+    font-size: 28px;
+    color: var(--text-primary);
+    margin-top: 8px;
+    line-height: 1.1;
+}}
+.metric::after {{
+    content: "";
+    position: absolute;
+    left: 0;
+    bottom: 0;
+    height: 2px;
+    width: 100%;
+    background: linear-gradient(90deg, transparent, var(--accent-2), transparent);
+    animation: shimmer 2.8s ease-in-out infinite;
+    opacity: .6;
+}}
+@keyframes shimmer {{
+    0% {{ transform: translateX(-40%); }}
+    50% {{ transform: translateX(40%); }}
+    100% {{ transform: translateX(-40%); }}
+}}
+
+/* Animations helpers */
+.fade-in {{ animation: fadeIn .55s ease both; }}
+.slide-up {{ animation: slideUp .6s cubic-bezier(.2,.7,.3,1) both; }}
+.pop-in {{ animation: popIn .25s ease both; }}
+@keyframes fadeIn {{
+    from {{ opacity: 0; transform: translateY(6px); }}
+    to   {{ opacity: 1; transform: translateY(0); }}
+}}
+@keyframes slideUp {{
+    from {{ opacity: 0; transform: translateY(10px); }}
+    to   {{ opacity: 1; transform: translateY(0); }}
+}}
+@keyframes popIn {{
+    from {{ transform: scale(.98); opacity: .0; }}
+    to   {{ transform: scale(1); opacity: 1; }}
+}}
+
+/* Buttons */
+.stButton>button {{
+    border-radius: 12px;
+    border: 1px solid var(--border-color);
+    background: linear-gradient(180deg, rgba(255,255,255,.14), rgba(255,255,255,.06));
+    color: var(--text-primary);
+    font-weight: 700 !important;
+    letter-spacing: .2px;
+    transition: transform .18s ease, box-shadow .18s ease, border-color .18s ease;
+}}
+.stButton>button:hover {{
+    transform: translateY(-2px);
+    box-shadow: 0 16px 32px rgba(0,0,0,.25);
+    border-color: rgba(99,102,241,0.55);
+}}
+.stButton>button:active {{
+    transform: translateY(0px) scale(.99);
+}}
+
+/* Inputs focus ring */
+input:focus, textarea:focus, select:focus {{
+    outline: none !important;
+    box-shadow: 0 0 0 3px var(--ring);
+    border-color: rgba(99,102,241,0.55) !important;
+}}
+
+/* Headings and typography overrides */
+h1, h2, h3, h4, label, p, span, div, small {{
+    color: var(--text-primary);
+}}
+.muted {{ color: var(--text-secondary) !important; }}
+
+/* Dataframe rounding */
+.stDataFrame, .stTable {{
+    border-radius: 14px !important;
+}}
+
+/* Subtle pill */
+.pill {{
+    display: inline-flex;
+    align-items: center;
+    gap: 8px;
+    padding: 6px 10px;
+    border-radius: 999px;
+    background: rgba(99,102,241,0.14);
+    color: var(--text-primary);
+    border: 1px solid var(--border-color);
+    font-size: 12.5px;
+    letter-spacing: .15px;
+}}
+.pill .dot {{
+    width: 8px; height: 8px; border-radius: 999px; background: var(--accent-2);
+    box-shadow: 0 0 0 3px rgba(6,182,212,0.25);
+}}
+
+/* Divider */
+.divider {{
+    height: 1px;
+    width: 100%;
+    background: linear-gradient(90deg, transparent, rgba(255,255,255,.25), transparent);
+    margin: 14px 0 10px 0;
+}}
+"""
+
+# Rendered and minified once at import instead of on every rerun
+_CSS = minify_css(_CSS_TEMPLATE.format(**_ACCENT_TOKENS))
+
+# Upserts the stylesheet as a <style> in the parent document's <head>. Nodes
+# there are not owned by Streamlit, so the styles outlive reruns that don't
+# re-emit this component and only have to be sent once per session.
+_CSS_INJECT_HTML = """
+<script>
+    const doc = window.parent.document;
+    let style = doc.getElementById("ledgerly-dashboard-css");
+    if (!style) {
+        style = doc.createElement("style");
+        style.id = "ledgerly-dashboard-css";
+        doc.head.appendChild(style);
+    }
+    style.textContent = __CSS__;
+</script>
+"""
+
+
+# ============================= Quick Tips ============================= #
+# Contextual helper shown after a dashboard quick action
+_QUICK_TIPS: Dict[str, str] = {
+    "sale": "Use the Sales page to add items with quantity and price; inventory auto-adjusts.",
+    "stock": "Use Inventory to add/update items and thresholds (alerts fire automatically).",
+    "expense": "Use Expenses to record costs with categories; breakdown shows in Reports.",
+    "reports": "Open Reports to visualize trends, top items, and forecasts.",
+}
+
+
+# =============================== Charts =============================== #
+# Transparent chart surfaces so the frosted cards show through
+_CHART_LAYOUT = dict(
+    plot_bgcolor="rgba(0,0,0,0)",
+    paper_bgcolor="rgba(0,0,0,0)",
+    margin=dict(l=10, r=10, t=48, b=10),
+)
+
+
+# Line charts rarely benefit from more points than a card-width canvas has
+# pixels; hover lookups and first render scale with the points sent
+_TREND_MAX_POINTS = 1000
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling of a numeric series.
+
+    Keeps the first and last points and, for each of the n_out - 2 buckets in
+    between, the point forming the largest triangle with the previously kept
+    point and the mean of the next bucket. Returns the indices of the kept
+    points (all of them when the series already fits), so callers can index
+    their original arrays: the float64 maths here would round nanosecond
+    timestamps.
+    """
+    n = len(x)
+    if n_out < 3 or n <= n_out:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)  # bucket i is [edges[i], edges[i+1])
+    counts = np.diff(edges)
+    # Mean of each bucket, plus the last point as the final look-ahead target
+    mean_x = np.append(np.add.reduceat(x[:-1], edges[:-1]) / counts, x[-1])
+    mean_y = np.append(np.add.reduceat(y[:-1], edges[:-1]) / counts, y[-1])
+
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        cx, cy = mean_x[i + 1], mean_y[i + 1]
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def _frame_key(df: pd.DataFrame) -> int:
+    """Content hash used to key cached figures."""
+    return int(pd.util.hash_pandas_object(df, index=False).sum())
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _top_items_figure(_top_items: pd.DataFrame, key: int) -> go.Figure:
+    import plotly.graph_objects as go
+
+    qty = _top_items["qty"].to_numpy()
+    return go.Figure(
+        data=[
+            go.Bar(
+                x=_top_items["item"].to_numpy(),
+                y=qty,
+                marker=dict(color=qty, colorscale="Viridis", showscale=True),
+            )
+        ],
+        layout=dict(title="Top 5 Items Sold", xaxis_title="item", yaxis_title="qty", **_CHART_LAYOUT),
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _trend_figure(_trend: pd.DataFrame, key: int) -> go.Figure:
+    import plotly.graph_objects as go
+
+    x = pd.to_datetime(_trend["date"]).to_numpy("datetime64[ns]")
+    y = _trend["total"].to_numpy()
+    if len(x) > _TREND_MAX_POINTS:
+        keep = _lttb(x.astype(np.int64), y, _TREND_MAX_POINTS)
+        x, y = x[keep], y[keep]
+    return go.Figure(
+        data=[go.Scatter(x=x, y=y, mode="lines", line=dict(color="#6366f1", width=3, shape="spline"))],
+        layout=dict(title="Monthly Sales Trend", xaxis_title="date", yaxis_title="total", **_CHART_LAYOUT),
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _breakdown_figure(_breakdown: pd.DataFrame, key: int) -> go.Figure:
+    import plotly.graph_objects as go
+
+    return go.Figure(
+        data=[go.Pie(labels=_breakdown["category"].to_numpy(), values=_breakdown["amount"].to_numpy())],
+        layout=dict(title="Expense Distribution by Category", **_CHART_LAYOUT),
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _forecast_figure(forecast_value: float, start: datetime.date) -> go.Figure:
+    import plotly.graph_objects as go
+
+    # Lightweight illustrative curve
+    dates = pd.date_range(start, periods=7, freq="D")
+    vals = forecast_value * (0.82 + 0.38 * np.linspace(0, 1, 7))
+    return go.Figure(
+        data=[
+            go.Scatter(
+                x=dates,
+                y=vals,
+                mode="lines+markers",
+                name="Forecast",
+                line=dict(color="#06b6d4", width=3),
+            )
+        ],
+        layout=dict(title="7-Day Sales Forecast", **_CHART_LAYOUT),
+    )
+
+
+# ========================== CSV Normalization ========================== #
+# Header cleanup: spaces and dashes both become underscores
+_COL_TRANS = str.maketrans({" ": "_", "-": "_"})
+
+
+# Uploads above this size are parsed in chunks to bound peak memory
+_CSV_CHUNK_BYTES = 32 * 1024 * 1024
+_CSV_CHUNK_ROWS = 200_000
+
+
+def _flatten(mapping: Dict[str, List[str]]) -> Dict[str, str]:
+    """Expand {target: [synonyms]} into {target: target, synonym: target, ...}."""
+    flat: Dict[str, str] = {}
+    for target, syns in mapping.items():
+        flat[target] = target
+        flat.update(dict.fromkeys(syns, target))
+    return flat
 
 
 # ============================== Dashboard ============================== #
@@ -55,339 +421,150 @@ class Dashboard:
 
     # --------------------------- Initialization --------------------------- #
     def __init__(self) -> None:
-        # Services (unchanged contracts)
+        # Services (unchanged contracts); main.get_dashboard caches the whole
+        # Dashboard, so these are built once per process
         self.billing = BillingService()
         self.stock = StockService()
         self.analytics = AnalyticsService()
         self.reminder = ReminderService()
 
+    def prepare_session(self) -> None:
+        """Per-run setup; the Dashboard itself may be shared across sessions."""
         # Session defaults
-        if "theme" not in st.session_state:
-            st.session_state.theme = "light"
         if "quick_action" not in st.session_state:
             st.session_state.quick_action = None
 
-        self._inject_css()  # first paint with current theme
+        self._inject_css()
 
     # ------------------------------ Theming ------------------------------ #
     def _inject_css(self) -> None:
-        """Inject global CSS: animated gradient, frosted cards, micro-UX."""
-        is_dark = (st.session_state.get("theme") == "dark")
-
-        # Color tokens for both themes
-        text_primary = "#E5E7EB" if is_dark else "#0F172A"
-        text_secondary = "#9CA3AF" if is_dark else "#475569"
-        border_color = "rgba(255,255,255,0.18)" if is_dark else "rgba(15,23,42,0.08)"
-        card_bg = "rgba(255,255,255,0.08)" if is_dark else "rgba(255,255,255,0.85)"
-        subtle_bg = "rgba(255,255,255,0.06)" if is_dark else "#F8FAFC"
-        card_shadow = "0 16px 40px rgba(0,0,0,0.45)" if is_dark else "0 18px 34px rgba(2,6,23,0.08)"
-        ring_color = "rgba(59,130,246,0.35)"  # focus ring
-
-        # Accent palette (kept constant for brand recognition)
-        accent_1 = "#6366F1"  # indigo
-        accent_2 = "#06B6D4"  # cyan
-        accent_3 = "#10B981"  # emerald
-        accent_4 = "#F59E0B"  # amber
-        accent_danger = "#EF4444"
-
-        # Animated gradient backdrop (infinite pan)
-        st.markdown(
-            f"""
-            <style>
-            :root {{
-                --text-primary: {text_primary};
-                --text-secondary: {text_secondary};
-                --border-color: {border_color};
-                --card-bg: {card_bg};
-                --subtle-bg: {subtle_bg};
-                --card-shadow: {card_shadow};
-                --ring: {ring_color};
-                --accent-1: {accent_1};
-                --accent-2: {accent_2};
-                --accent-3: {accent_3};
-                --accent-4: {accent_4};
-                --accent-danger: {accent_danger};
-            }}
-
-            /* App background with animated gradient */
-            .stApp {{
-                background: radial-gradient(1200px 600px at 20% 10%, rgba(99,102,241,0.22), transparent 60%),
-                            radial-gradient(1200px 600px at 80% 0%, rgba(6,182,212,0.18), transparent 60%),
-                            linear-gradient(135deg, #0f172a 0%, #1e293b 40%, #0b1020 100%);
-                background-size: 180% 180%;
-                animation: bgShift 24s ease-in-out infinite alternate;
-            }}
-            @keyframes bgShift {{
-                0% {{ background-position: 0% 20%, 100% 0%, 0% 0%; }}
-                50% {{ background-position: 50% 40%, 50% 50%, 50% 50%; }}
-                100% {{ background-position: 100% 20%, 0% 0%, 100% 100%; }}
-            }}
-
-            /* Glass card container */
-            .glass {{
-                background: var(--card-bg);
-                border: 1px solid var(--border-color);
-                border-radius: 18px;
-                box-shadow: var(--card-shadow);
-                -webkit-backdrop-filter: saturate(140%) blur(14px);
-                backdrop-filter: saturate(140%) blur(14px);
-                padding: 18px 18px;
-                transition: transform .24s ease, box-shadow .24s ease, border-color .2s ease;
-            }}
-            .glass:hover {{
-                transform: translateY(-3px);
-                box-shadow: 0 24px 48px rgba(0,0,0,0.3);
-                border-color: rgba(99,102,241,0.45);
-            }}
-
-            /* Soft section container */
-            .soft {{
-                background: var(--subtle-bg);
-                border-radius: 14px;
-                border: 1px dashed rgba(125,125,125,0.16);
-                padding: 16px 16px;
-            }}
-
-            /* Metric card with shimmer underline */
-            .metric {{
-                position: relative;
-                overflow: hidden;
-            }}
-            .metric h3 {{
-                margin: 0;
-                color: var(--text-secondary);
-                font-size: 13.5px;
-                letter-spacing: .2px;
-                text-transform: uppercase;
-            }}
-            .metric .value {{
-                font-weight: 800;
-                font-size: 28px;
-                color: var(--text-primary);
-                margin-top: 8px;
-                line-height: 1.1;
-            }}
-            .metric::after {{
-                content: "";
-                position: absolute;
-                left: 0;
-                bottom: 0;
-                height: 2px;
-                width: 100%;
-                background: linear-gradient(90deg, transparent, var(--accent-2), transparent);
-                animation: shimmer 2.8s ease-in-out infinite;
-                opacity: .6;
-            }}
-            @keyframes shimmer {{
-                0% {{ transform: translateX(-40%); }}
-                50% {{ transform: translateX(40%); }}
-                100% {{ transform: translateX(-40%); }}
-            }}
-
-            /* Animations helpers */
-            .fade-in {{ animation: fadeIn .55s ease both; }}
-            .slide-up {{ animation: slideUp .6s cubic-bezier(.2,.7,.3,1) both; }}
-            .pop-in {{ animation: popIn .25s ease both; }}
-            @keyframes fadeIn {{
-                from {{ opacity: 0; transform: translateY(6px); }}
-                to   {{ opacity: 1; transform: translateY(0); }}
-            }}
-            @keyframes slideUp {{
-                from {{ opacity: 0; transform: translateY(10px); }}
-                to   {{ opacity: 1; transform: translateY(0); }}
-            }}
-            @keyframes popIn {{
-                from {{ transform: scale(.98); opacity: .0; }}
-                to   {{ transform: scale(1); opacity: 1; }}
-            }}
-
-            /* Buttons */
-            .stButton>button {{
-                border-radius: 12px;
-                border: 1px solid var(--border-color);
-                background: linear-gradient(180deg, rgba(255,255,255,.14), rgba(255,255,255,.06));
-                color: var(--text-primary);
-                font-weight: 700 !important;
-                letter-spacing: .2px;
-                transition: transform .18s ease, box-shadow .18s ease, border-color .18s ease;
-            }}
-            .stButton>button:hover {{
-                transform: translateY(-2px);
-                box-shadow: 0 16px 32px rgba(0,0,0,.25);
-                border-color: rgba(99,102,241,0.55);
-            }}
-            .stButton>button:active {{
-                transform: translateY(0px) scale(.99);
-            }}
-
-            /* Inputs focus ring */
-            input:focus, textarea:focus, select:focus {{
-                outline: none !important;
-                box-shadow: 0 0 0 3px var(--ring);
-                border-color: rgba(99,102,241,0.55) !important;
-            }}
-
-            /* Headings and typography overrides */
-            h1, h2, h3, h4, label, p, span, div, small {{
-                color: var(--text-primary);
-            }}
-            .muted {{ color: var(--text-secondary) !important; }}
-
-            /* Dataframe rounding */
-            .stDataFrame, .stTable {{
-                border-radius: 14px !important;
-            }}
-
-            /* Subtle pill */
-            .pill {{
-                display: inline-flex;
-                align-items: center;
-                gap: 8px;
-                padding: 6px 10px;
-                border-radius: 999px;
-                background: rgba(99,102,241,0.14);
-                color: var(--text-primary);
-                border: 1px solid var(--border-color);
-                font-size: 12.5px;
-                letter-spacing: .15px;
-            }}
-            .pill .dot {{
-                width: 8px; height: 8px; border-radius: 999px; background: var(--accent-2);
-                box-shadow: 0 0 0 3px rgba(6,182,212,0.25);
-            }}
-
-            /* Divider */
-            .divider {{
-                height: 1px;
-                width: 100%;
-                background: linear-gradient(90deg, transparent, rgba(255,255,255,.25), transparent);
-                margin: 14px 0 10px 0;
-            }}
-            </style>
-            """,
-            unsafe_allow_html=True,
-        )
+        """Inject the global CSS once per session; its colours follow the shell theme."""
+        if st.session_state.get("_dashboard_css_injected"):
+            return
+        components.html(_CSS_INJECT_HTML.replace("__CSS__", json.dumps(_CSS)), height=0)
+        st.session_state._dashboard_css_injected = True
 
     # -------------------------- CSV Normalization -------------------------- #
+    # Header synonyms, flattened once to {cleaned_header: target}
+    _SALES_SYN = _flatten({
+        "item": ["product", "product_name", "item_name", "name", "sku", "title"],
+        "qty": ["quantity", "units", "count", "qnty", "qnt", "qty_sold"],
+        "unit_price": ["price", "rate", "unitprice", "selling_price", "mrp", "unit_cost"],
+        "customer": ["customer_name", "client", "buyer", "member", "party"],
+    })
+    _INV_SYN = _flatten({
+        "item": ["item_name", "product", "name", "sku", "title"],
+        "qty": ["quantity", "stock", "on_hand", "units"],
+        "threshold": ["reorder_level", "reorder_point", "min_qty", "min_stock"],
+        "unit_cost": ["cost", "purchase_price", "unitprice", "base_cost"],
+    })
+    _EXP_SYN = _flatten({
+        "category": ["type", "head", "expense_category"],
+        "vendor": ["supplier", "party", "payee", "seller"],
+        "amount": ["amt", "value", "cost", "price", "total", "expense"],
+        "notes": ["note", "remark", "remarks", "description"],
+    })
+
     @staticmethod
     def _clean_cols(cols: Iterable[str]) -> List[str]:
-        return [str(c).strip().lower().replace(" ", "_").replace("-", "_") for c in cols]
-
-    def _rename_with_synonyms(self, df: pd.DataFrame, mapping: Dict[str, List[str]]) -> pd.DataFrame:
-        df = df.copy()
-        df.columns = self._clean_cols(df.columns)
-        rename_map: Dict[str, str] = {}
-        for target, syns in mapping.items():
-            for c in df.columns:
-                if c == target or c in syns:
-                    rename_map[c] = target
-        if rename_map:
-            df = df.rename(columns=rename_map)
+        out: List[str] = []
+        for c in cols:
+            s = str(c)
+            # Lowercase identifiers have no padding, spaces or dashes: already canonical
+            out.append(s if s.isidentifier() and s.islower() else s.strip().lower().translate(_COL_TRANS))
+        return out
+
+    @staticmethod
+    def _norm_str(s: pd.Series) -> pd.Series:
+        """Trimmed text column; missing values become "" rather than "nan"/"None"."""
+        # Arrow-backed strings (pyarrow ships with Streamlit): compact, C-level .str ops
+        return s.astype("string[pyarrow]").str.strip().fillna("")
+
+    @staticmethod
+    def _norm_count(s: pd.Series, default: float = 0) -> pd.Series:
+        """Numeric quantity column, downcast to the smallest int dtype when every value is whole."""
+        # Money columns are left float64: a float downcast would round prices
+        return pd.to_numeric(pd.to_numeric(s, errors="coerce").fillna(default), downcast="integer")
+
+    def _rename_with_synonyms(self, df: pd.DataFrame, flat: Dict[str, str]) -> pd.DataFrame:
+        # Shallow copy: only the column Index is replaced, the data blocks are shared
+        df = df.copy(deep=False)
+        df.columns = [flat.get(c, c) for c in self._clean_cols(df.columns)]
         return df
 
     def _normalize_sales_df(self, df: pd.DataFrame) -> pd.DataFrame:
-        mapping = {
-            "item": ["product", "product_name", "item_name", "name", "sku", "title"],
-            "qty": ["quantity", "units", "count", "qnty", "qnt", "qty_sold"],
-            "unit_price": ["price", "rate", "unitprice", "selling_price", "mrp", "unit_cost"],
-            "customer": ["customer_name", "client", "buyer", "member", "party"],
-        }
-        df = self._rename_with_synonyms(df, mapping)
+        df = self._rename_with_synonyms(df, self._SALES_SYN)
         # Ensure columns exist
         for col in ["item", "qty", "unit_price", "customer"]:
             if col not in df.columns:
                 df[col] = "" if col in ("item", "customer") else 0
         # Coerce
-        df["item"] = df["item"].astype(str).str.strip()
-        df["customer"] = df["customer"].astype(str).fillna("").str.strip()
-        df["qty"] = pd.to_numeric(df["qty"], errors="coerce").fillna(1)
+        df["item"] = self._norm_str(df["item"])
+        df["customer"] = self._norm_str(df["customer"])
+        df["qty"] = self._norm_count(df["qty"], default=1)
         df["unit_price"] = pd.to_numeric(df["unit_price"], errors="coerce").fillna(0)
-        # Filters
-        df = df[df["item"].str.len() > 0]
-        df = df[df["qty"] > 0]
-        return df[["item", "qty", "unit_price", "customer"]]
+        # Line totals in one column operation, so the bulk insert needn't compute them per row
+        df["total"] = df["qty"] * df["unit_price"]
+        # Filters, as a single mask and projection
+        mask = (df["item"] != "").to_numpy(dtype=bool) & (df["qty"].to_numpy() > 0)
+        return df.loc[mask, ["item", "qty", "unit_price", "customer", "total"]].reset_index(drop=True)
 
     def _normalize_inventory_df(self, df: pd.DataFrame) -> pd.DataFrame:
-        mapping = {
-            "item": ["item_name", "product", "name", "sku", "title"],
-            "qty": ["quantity", "stock", "on_hand", "units"],
-            "threshold": ["reorder_level", "reorder_point", "min_qty", "min_stock"],
-            "unit_cost": ["cost", "purchase_price", "unitprice", "base_cost"],
-        }
-        df = self._rename_with_synonyms(df, mapping)
+        df = self._rename_with_synonyms(df, self._INV_SYN)
         for col in ["item", "qty", "threshold", "unit_cost"]:
             if col not in df.columns:
                 df[col] = "" if col == "item" else 0
-        df["item"] = df["item"].astype(str).str.strip()
-        df["qty"] = pd.to_numeric(df["qty"], errors="coerce").fillna(0)
-        df["threshold"] = pd.to_numeric(df["threshold"], errors="coerce").fillna(0)
+        df["item"] = self._norm_str(df["item"])
+        df["qty"] = self._norm_count(df["qty"])
+        df["threshold"] = self._norm_count(df["threshold"])
         df["unit_cost"] = pd.to_numeric(df["unit_cost"], errors="coerce").fillna(0)
-        df = df[df["item"].str.len() > 0]
-        return df[["item", "qty", "threshold", "unit_cost"]]
+        mask = (df["item"] != "").to_numpy(dtype=bool)
+        return df.loc[mask, ["item", "qty", "threshold", "unit_cost"]].reset_index(drop=True)
 
     def _normalize_expenses_df(self, df: pd.DataFrame) -> pd.DataFrame:
-        mapping = {
-            "category": ["type", "head", "expense_category"],
-            "vendor": ["supplier", "party", "payee", "seller"],
-            "amount": ["amt", "value", "cost", "price", "total", "expense"],
-            "notes": ["note", "remark", "remarks", "description"],
-        }
-        df = self._rename_with_synonyms(df, mapping)
+        df = self._rename_with_synonyms(df, self._EXP_SYN)
         for col in ["category", "vendor", "amount", "notes"]:
             if col not in df.columns:
                 df[col] = "" if col in ("category", "vendor", "notes") else 0
-        df["category"] = df["category"].astype(str).str.strip()
-        df["vendor"] = df["vendor"].astype(str).fillna("").str.strip()
-        df["notes"] = df["notes"].astype(str).fillna("").str.strip()
+        df["category"] = self._norm_str(df["category"])
+        df["vendor"] = self._norm_str(df["vendor"])
+        df["notes"] = self._norm_str(df["notes"])
         df["amount"] = pd.to_numeric(df["amount"], errors="coerce").fillna(0)
-        df = df[df["category"].str.len() > 0]
-        df = df[df["amount"] > 0]
-        return df[["category", "vendor", "amount", "notes"]]
+        mask = (df["category"] != "").to_numpy(dtype=bool) & (df["amount"].to_numpy() > 0)
+        return df.loc[mask, ["category", "vendor", "amount", "notes"]].reset_index(drop=True)
 
     # ----------------------------- UI Primitives ----------------------------- #
     def _header(self, title: str, subtitle: Optional[str] = None, badge: Optional[str] = None) -> None:
-        st.markdown('<div class="glass fade-in">', unsafe_allow_html=True)
-        # Title row: title + theme toggle
-        left, right = st.columns([0.82, 0.18])
-        with left:
-            st.markdown(
-                f"""
-                <div style="display:flex;align-items:center;gap:12px;">
-                    <div class="pill"><span class="dot"></span> Ledgerly</div>
-                    <h1 style="margin:.2rem 0 0 0;">{title}</h1>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
-            if subtitle:
-                st.markdown(f"<p class='muted' style='margin:.2rem 0 0 0;'>{subtitle}</p>", unsafe_allow_html=True)
-            if badge:
-                st.markdown(f"<div class='pill' style='margin-top:10px;'>{badge}</div>", unsafe_allow_html=True)
-        with right:
-            # Theme toggle is sticky per session; re-inject CSS on change
-            toggle = st.toggle("🌙 Dark Mode", value=(st.session_state.theme == "dark"))
-            new_theme = "dark" if toggle else "light"
-            if new_theme != st.session_state.theme:
-                st.session_state.theme = new_theme
-                self._inject_css()
-                st.experimental_rerun()
-        st.markdown("</div>", unsafe_allow_html=True)
-
-    def _metric(self, title: str, value: str, delta: Optional[float] = None, positive: bool = True) -> None:
-        color = "var(--accent-3)" if positive else "var(--accent-danger)"
-        sign = "+" if (delta is not None and delta >= 0) else ""
-        delta_html = f"<div class='muted' style='font-size:13px;margin-top:4px;color:{color};'>{sign}{delta:.1f}%</div>" if delta is not None else ""
+        # Theme switching is the shell's fixed toggle (app.py), not part of the page
+        subtitle_html = f"<p class='muted' style='margin:.2rem 0 0 0;'>{subtitle}</p>" if subtitle else ""
+        badge_html = f"<div class='pill' style='margin-top:10px;'>{badge}</div>" if badge else ""
         st.markdown(
             f"""
-            <div class="glass metric pop-in">
-                <h3>{title}</h3>
-                <div class="value">{value}</div>
-                {delta_html}
+            <div style="display:flex;align-items:center;gap:12px;">
+                <div class="pill"><span class="dot"></span> Ledgerly</div>
+                <h1 style="margin:.2rem 0 0 0;">{title}</h1>
             </div>
+            {subtitle_html}
+            {badge_html}
             """,
             unsafe_allow_html=True,
         )
 
+    def _metric(self, title: str, value: str, delta: Optional[float] = None, positive: bool = True) -> str:
+        color = "var(--accent-3)" if positive else "var(--accent-danger)"
+        sign = "+" if (delta is not None and delta >= 0) else ""
+        delta_html = f"<div class='muted' style='font-size:13px;margin-top:4px;color:{color};'>{sign}{delta:.1f}%</div>" if delta is not None else ""
+        # Single line: cards are joined into one markdown block, where blank or
+        # indented lines would end the HTML block
+        return (
+            f"<div class='glass metric pop-in'><h3>{title}</h3>"
+            f"<div class='value'>{value}</div>{delta_html}</div>"
+        )
+
+    def _metric_row(self, cards: Iterable[str]) -> None:
+        """Render KPI cards (from _metric) as one grid element instead of one per column."""
+        st.markdown(f"<div class='kpi-row'>{''.join(cards)}</div>", unsafe_allow_html=True)
+
     def _soft_block(self, title: str, body_html: str) -> None:
         st.markdown(
             f"""
@@ -410,34 +587,23 @@ class Dashboard:
         self._header("📊 Dashboard", "Your business insights at a glance", badge="Realtime KPIs")
 
         # Top KPI metrics row
-        col1, col2, col3, col4 = st.columns(4)
-        try:
-            todays_sales = float(self.analytics.get_todays_sales())
-        except Exception:
-            todays_sales = 0.0
-        try:
-            todays_expenses = float(self.analytics.get_todays_expenses())
-        except Exception:
-            todays_expenses = 0.0
         try:
-            net_profit = float(self.analytics.get_net_profit())
+            todays_sales, todays_expenses = self.analytics.get_todays_totals()
         except Exception:
-            net_profit = todays_sales - todays_expenses
+            todays_sales, todays_expenses = 0.0, 0.0
+        net_profit = todays_sales - todays_expenses
         try:
-            stock_items = self.stock.get_stock()
-            total_items = len(stock_items) if stock_items else 0
+            total_items = self.stock.count()
         except Exception:
             total_items = 0
 
-        with col1:
-            self._metric("Today's Sales", f"{CURRENCY_SYMBOL}{todays_sales:,.2f}", delta=12.5, positive=True)
-        with col2:
+        self._metric_row([
+            self._metric("Today's Sales", format_currency(todays_sales), delta=12.5, positive=True),
             # negative delta colored red via _metric logic
-            self._metric("Today's Expenses", f"{CURRENCY_SYMBOL}{todays_expenses:,.2f}", delta=-5.2, positive=False)
-        with col3:
-            self._metric("Net Profit", f"{CURRENCY_SYMBOL}{net_profit:,.2f}", delta=8.3, positive=True)
-        with col4:
-            self._metric("Stock Items", f"{total_items}", delta=2.1, positive=True)
+            self._metric("Today's Expenses", format_currency(todays_expenses), delta=-5.2, positive=False),
+            self._metric("Net Profit", format_currency(net_profit), delta=8.3, positive=True),
+            self._metric("Stock Items", f"{total_items}", delta=2.1, positive=True),
+        ])
 
         # Alerts and receivables
         colA, colB = st.columns([1, 1])
@@ -448,7 +614,7 @@ class Dashboard:
                 alerts = []
                 st.caption(f"ℹ️ Alerts unavailable: {e}")
             if alerts:
-                body = "<ul style='margin:0;padding-left:18px;'>" + "".join([f"<li>{a}</li>" for a in alerts]) + "</ul>"
+                body = "<ul style='margin:0;padding-left:18px;'>" + "".join(f"<li>{escape(a)}</li>" for a in alerts) + "</ul>"
             else:
                 body = "<div class='pill'><span class='dot'></span> No low stock alerts.</div>"
             self._soft_block("🚨 Low Stock Alerts", body)
@@ -460,17 +626,15 @@ class Dashboard:
                 dues = []
                 st.caption(f"ℹ️ Receivables unavailable: {e}")
 
-            st.markdown('<div class="glass slide-up">', unsafe_allow_html=True)
             st.subheader("💰 Pending Receivables")
             if dues:
-                df = pd.DataFrame(dues, columns=["Customer", "Amount", "Due Date"])
-                st.dataframe(df, use_container_width=True, height=240)
+                customers, amounts, due_dates = zip(*dues)
+                tbl = pa.table({"Customer": customers, "Amount": amounts, "Due Date": due_dates})
+                st.dataframe(tbl, use_container_width=True, height=240)
             else:
                 st.info("✅ No pending dues.")
-            st.markdown("</div>", unsafe_allow_html=True)
 
         # Quick actions as frosted buttons
-        st.markdown('<div class="glass slide-up">', unsafe_allow_html=True)
         st.subheader("⚡ Quick Actions")
         qa1, qa2, qa3, qa4 = st.columns(4)
         with qa1:
@@ -485,16 +649,12 @@ class Dashboard:
         with qa4:
             if st.button("📊 View Reports", use_container_width=True):
                 st.session_state.quick_action = "reports"
-        st.markdown("</div>", unsafe_allow_html=True)
+        # KPIs are cached for a minute; the callback clears them before the rerun
+        st.button("🔄 Refresh Data", on_click=clear_analytics_cache)
 
         # Contextual helper after a quick action selection
         if st.session_state.quick_action:
-            tip = {
-                "sale": "Use the Sales page to add items with quantity and price; inventory auto-adjusts.",
-                "stock": "Use Inventory to add/update items and thresholds (alerts fire automatically).",
-                "expense": "Use Expenses to record costs with categories; breakdown shows in Reports.",
-                "reports": "Open Reports to visualize trends, top items, and forecasts.",
-            }.get(st.session_state.quick_action, "")
+            tip = _QUICK_TIPS.get(st.session_state.quick_action, "")
             st.markdown(
                 f"<div class='glass pop-in' style='border-left:4px solid var(--accent-2);'><b>Quick Tip ·</b> {tip}</div>",
                 unsafe_allow_html=True,
@@ -521,6 +681,7 @@ class Dashboard:
                 total = qty * unit_price
                 try:
                     sale_id = self.billing.add_sale(item, qty, unit_price, total, customer)
+                    clear_analytics_cache()
                     st.success(f"✅ Sale added successfully! Receipt ID: {sale_id}")
 
                     with st.expander("📄 View Receipt", expanded=True):
@@ -531,8 +692,8 @@ class Dashboard:
                                 <div class="divider"></div>
                                 <p><b>Item:</b> {item}</p>
                                 <p><b>Quantity:</b> {qty}</p>
-                                <p><b>Unit Price:</b> {CURRENCY_SYMBOL}{unit_price:,.2f}</p>
-                                <p><b>Total:</b> {CURRENCY_SYMBOL}{total:,.2f}</p>
+                                <p><b>Unit Price:</b> {format_currency(unit_price)}</p>
+                                <p><b>Total:</b> {format_currency(total)}</p>
                                 <p><b>Customer:</b> {customer or 'Walk-in'}</p>
                                 <p><b>Date:</b> {parse_date('today')}</p>
                             </div>
@@ -542,12 +703,10 @@ class Dashboard:
                 except Exception as e:
                     st.error(f"❌ Error adding sale: {str(e)}")
 
-        st.markdown('<div class="glass slide-up">', unsafe_allow_html=True)
         c1, c2 = st.columns([1, 1])
         with c1:
             if st.button("🎤 Simulate Voice Input", use_container_width=True):
                 st.info("🗣️ Voice command parsed: 'Add sale of 2 sugar at 50 each for John'")
-        st.markdown("</div>", unsafe_allow_html=True)
 
     # ------------------------------- Expenses ------------------------------- #
     def show_expenses(self) -> None:
@@ -571,6 +730,7 @@ class Dashboard:
                 try:
                     clean_category = category.split(" ", 1)[1] if " " in category else category
                     self.billing.add_expense(clean_category, vendor, amount, notes)
+                    clear_analytics_cache()
                     st.success("✅ Expense added successfully!")
                 except Exception as e:
                     st.error(f"❌ Error adding expense: {str(e)}")
@@ -604,19 +764,19 @@ class Dashboard:
         try:
             stock_data = self.stock.get_stock()
             if stock_data:
-                df = pd.DataFrame(stock_data, columns=["Item", "Quantity", "Threshold", "Unit Cost"])
-
-                # Status derivation
-                def status(row):
-                    if row["Quantity"] <= row["Threshold"]:
-                        return "🔴 Low"
-                    elif row["Quantity"] <= row["Threshold"] * 2:
-                        return "🟡 Medium"
-                    return "🟢 Good"
-
-                df["Status"] = df.apply(status, axis=1)
-                df["Unit Cost"] = df["Unit Cost"].apply(lambda x: f"{CURRENCY_SYMBOL}{x:.2f}")
-                st.dataframe(df, use_container_width=True, height=340)
+                # Columnar Arrow table straight from the rows (st.dataframe ships Arrow anyway)
+                items, qty, threshold, unit_cost = zip(*stock_data)
+                q = np.asarray(qty, dtype=float)
+                t = np.asarray(threshold, dtype=float)
+                tbl = pa.table({
+                    "Item": items,
+                    "Quantity": q,
+                    "Threshold": t,
+                    "Unit Cost": format_currency_many(unit_cost),
+                    # Status derivation (vectorized)
+                    "Status": np.select([q <= t, q <= 2 * t], ["🔴 Low", "🟡 Medium"], default="🟢 Good"),
+                })
+                st.dataframe(tbl, use_container_width=True, height=340)
             else:
                 st.info("📦 No items in inventory yet. Add some items to get started!")
         except Exception as e:
@@ -635,19 +795,7 @@ class Dashboard:
             try:
                 top_items = self.analytics.get_top_items()
                 if not top_items.empty:
-                    fig = px.bar(
-                        top_items,
-                        x="item",
-                        y="qty",
-                        title="Top 5 Items Sold",
-                        color="qty",
-                        color_continuous_scale="viridis",
-                    )
-                    fig.update_layout(
-                        plot_bgcolor="rgba(0,0,0,0)",
-                        paper_bgcolor="rgba(0,0,0,0)",
-                        margin=dict(l=10, r=10, t=48, b=10),
-                    )
+                    fig = _top_items_figure(top_items, _frame_key(top_items))
                     st.plotly_chart(fig, use_container_width=True)
                 else:
                     st.info("📊 No sales data available yet.")
@@ -659,13 +807,7 @@ class Dashboard:
             try:
                 trend = self.analytics.get_monthly_trend("sales")
                 if not trend.empty:
-                    fig = px.line(trend, x="date", y="total", title="Monthly Sales Trend", line_shape="spline")
-                    fig.update_traces(line_color="#6366f1", line_width=3)
-                    fig.update_layout(
-                        plot_bgcolor="rgba(0,0,0,0)",
-                        paper_bgcolor="rgba(0,0,0,0)",
-                        margin=dict(l=10, r=10, t=48, b=10),
-                    )
+                    fig = _trend_figure(trend, _frame_key(trend))
                     st.plotly_chart(fig, use_container_width=True)
                 else:
                     st.info("📈 No trend data available yet.")
@@ -677,12 +819,7 @@ class Dashboard:
             try:
                 breakdown = self.analytics.get_expense_breakdown()
                 if not breakdown.empty:
-                    fig = px.pie(breakdown, names="category", values="amount", title="Expense Distribution by Category")
-                    fig.update_layout(
-                        plot_bgcolor="rgba(0,0,0,0)",
-                        paper_bgcolor="rgba(0,0,0,0)",
-                        margin=dict(l=10, r=10, t=48, b=10),
-                    )
+                    fig = _breakdown_figure(breakdown, _frame_key(breakdown))
                     st.plotly_chart(fig, use_container_width=True)
                 else:
                     st.info("💸 No expense data available yet.")
@@ -693,33 +830,14 @@ class Dashboard:
             st.subheader("🔮 Sales Forecast")
             try:
                 forecast_value = float(self.analytics.get_sales_forecast())
-                st.metric("7-Day Sales Forecast", f"{CURRENCY_SYMBOL}{forecast_value:,.2f}")
-
-                # Lightweight illustrative curve
-                dates = [datetime.date.today() + datetime.timedelta(days=i) for i in range(7)]
-                vals = [forecast_value * (0.82 + 0.38 * (i / 6)) for i in range(7)]
-                fig = go.Figure()
-                fig.add_trace(
-                    go.Scatter(
-                        x=dates,
-                        y=vals,
-                        mode="lines+markers",
-                        name="Forecast",
-                        line=dict(color="#06b6d4", width=3),
-                    )
-                )
-                fig.update_layout(
-                    title="7-Day Sales Forecast",
-                    plot_bgcolor="rgba(0,0,0,0)",
-                    paper_bgcolor="rgba(0,0,0,0)",
-                    margin=dict(l=10, r=10, t=48, b=10),
-                )
+                st.metric("7-Day Sales Forecast", format_currency(forecast_value))
+
+                fig = _forecast_figure(forecast_value, datetime.date.today())
                 st.plotly_chart(fig, use_container_width=True)
             except Exception as e:
                 st.error(f"❌ Error generating forecast: {str(e)}")
 
         # Export primary report
-        st.markdown('<div class="glass" style="margin-top:12px;">', unsafe_allow_html=True)
         c1, c2, c3 = st.columns(3)
         with c1:
             if st.button("📤 Export Top Items CSV", use_container_width=True):
@@ -732,74 +850,122 @@ class Dashboard:
                         st.warning("⚠️ No data to export.")
                 except Exception as e:
                     st.error(f"❌ Export error: {str(e)}")
-        st.markdown("</div>", unsafe_allow_html=True)
 
     # --------------------- Import (CSV/Excel) – Robust Path --------------------- #
+    @staticmethod
+    def _is_chunked(uploaded_file) -> bool:
+        """True for CSV uploads big enough to be streamed in chunks."""
+        name = str(getattr(uploaded_file, "name", "")).lower()
+        return not name.endswith((".xlsx", ".xls")) and (getattr(uploaded_file, "size", 0) or 0) > _CSV_CHUNK_BYTES
+
+    @staticmethod
+    def _read_tabular(uploaded_file) -> Iterator[pd.DataFrame]:
+        """
+        Parse an upload into one or more DataFrames:
+          - Large CSV: C engine in chunks of _CSV_CHUNK_ROWS rows
+          - Anything else: a single frame from _parse_upload
+        """
+        if Dashboard._is_chunked(uploaded_file):
+            # pyarrow can't stream chunks; the C engine can
+            uploaded_file.seek(0)
+            yield from pd.read_csv(uploaded_file, chunksize=_CSV_CHUNK_ROWS, low_memory=False)
+            return
+        yield Dashboard._parse_upload(uploaded_file)
+
+    @staticmethod
+    @st.cache_data(show_spinner=False, max_entries=4, hash_funcs={UploadedFile: lambda f: f.file_id})
+    def _parse_upload(uploaded_file) -> pd.DataFrame:
+        """
+        Parse a whole upload once per file; the preview and the import that
+        follows it share the result.
+          - Excel: calamine engine when installed, else pandas' default
+          - CSV: pyarrow engine when installed; the C engine when pyarrow
+            is missing or rejects the file (it is stricter, e.g. about short
+            rows), then Excel if it doesn't parse as CSV. Columns stay NumPy-backed:
+            on Arrow dtypes to_numeric(errors="coerce") leaves nulls that
+            fillna doesn't replace, so bad cells would lose their defaults
+        """
+        uploaded_file.seek(0)
+        name = str(getattr(uploaded_file, "name", "")).lower()
+        if name.endswith((".xlsx", ".xls")):
+            return Dashboard._read_excel(uploaded_file)
+        try:
+            try:
+                return pd.read_csv(uploaded_file, engine="pyarrow")
+            except Exception:
+                uploaded_file.seek(0)
+                return pd.read_csv(uploaded_file, low_memory=False)
+        except Exception:
+            uploaded_file.seek(0)
+            return Dashboard._read_excel(uploaded_file)
+
+    @staticmethod
+    @st.cache_data(show_spinner=False, max_entries=4, hash_funcs={UploadedFile: lambda f: f.file_id})
+    def _peek_upload(uploaded_file, rows: int = 5) -> Tuple[pd.DataFrame, int]:
+        """First rows of a streamed CSV plus its approximate row count, without a full parse."""
+        uploaded_file.seek(0)
+        head = pd.read_csv(uploaded_file, nrows=rows)
+        data = uploaded_file.getvalue()
+        # Newline scan in C, minus the header; quoted newlines make it approximate
+        lines = data.count(b"\n") + (not data.endswith(b"\n"))
+        return head, max(lines - 1, 0)
+
+    @staticmethod
+    def _read_excel(uploaded_file) -> pd.DataFrame:
+        try:
+            return pd.read_excel(uploaded_file, engine="calamine")
+        except (ImportError, ValueError):
+            uploaded_file.seek(0)
+            return pd.read_excel(uploaded_file)
+
+    @staticmethod
+    def _normalize_chunks(
+        chunks: Iterable[pd.DataFrame], normalize: Callable[[pd.DataFrame], pd.DataFrame]
+    ) -> Tuple[pd.DataFrame, int]:
+        """Normalize each parsed chunk and stitch the results; also return the dropped-row count."""
+        parts: List[pd.DataFrame] = []
+        seen = 0
+        for chunk in chunks:
+            seen += len(chunk)
+            parts.append(normalize(chunk))
+        norm = parts[0] if len(parts) == 1 else pd.concat(parts, ignore_index=True)
+        return norm, seen - len(norm)
+
     def process_csv_upload(self, uploaded_file, data_type: str) -> None:
         """
         Flexible import routine:
-          - Try CSV first; fallback to Excel (.xlsx)
+          - Parse via _read_tabular (CSV, chunked when large; Excel fallback)
           - Auto-map headers using robust synonyms
-          - Soft-validate per-row; skip bad rows with toast
+          - Soft-validate vectorized; one toast for the rows dropped
+          - Bulk insert in a single transaction per import
           - Success report at the end
         """
         try:
-            try:
-                df = pd.read_csv(uploaded_file)
-            except Exception:
-                uploaded_file.seek(0)
-                df = pd.read_excel(uploaded_file)
+            chunks = self._read_tabular(uploaded_file)
 
             if data_type == "Sales":
-                norm = self._normalize_sales_df(df)
-                success = 0
-                for _, row in norm.iterrows():
-                    try:
-                        item = str(row["item"])
-                        qty = float(row["qty"])
-                        price = float(row["unit_price"])
-                        total = qty * price
-                        customer = str(row.get("customer", "") or "")
-                        self.billing.add_sale(item, qty, price, total, customer)
-                        success += 1
-                    except Exception as e:
-                        st.toast(f"Skipped row · {e}", icon="⚠️")
+                norm, skipped = self._normalize_chunks(chunks, self._normalize_sales_df)
+                success = self.billing.add_sales_bulk(norm.to_dict("records"))
+                clear_analytics_cache()
                 st.success(f"✅ Imported {success} sales record(s).")
 
             elif data_type == "Inventory":
-                norm = self._normalize_inventory_df(df)
-                success = 0
-                for _, row in norm.iterrows():
-                    try:
-                        self.billing.add_stock_safe(
-                            str(row["item"]),
-                            float(row["qty"]),
-                            float(row["threshold"]),
-                            float(row["unit_cost"]),
-                        )
-                        success += 1
-                    except Exception as e:
-                        st.toast(f"Skipped row · {e}", icon="⚠️")
+                norm, skipped = self._normalize_chunks(chunks, self._normalize_inventory_df)
+                success = self.billing.add_stock_bulk(norm.to_dict("records"))
                 st.success(f"✅ Imported {success} inventory item(s).")
 
             elif data_type == "Expenses":
-                norm = self._normalize_expenses_df(df)
-                success = 0
-                for _, row in norm.iterrows():
-                    try:
-                        self.billing.add_expense(
-                            str(row["category"]),
-                            str(row.get("vendor", "") or ""),
-                            float(row["amount"]),
-                            str(row.get("notes", "") or ""),
-                        )
-                        success += 1
-                    except Exception as e:
-                        st.toast(f"Skipped row · {e}", icon="⚠️")
+                norm, skipped = self._normalize_chunks(chunks, self._normalize_expenses_df)
+                success = self.billing.add_expenses_bulk(norm.to_dict("records"))
+                clear_analytics_cache()
                 st.success(f"✅ Imported {success} expense record(s).")
 
             else:
                 st.error("❌ Unknown data type selected.")
+                return
+
+            if skipped:
+                st.toast(f"Skipped {skipped} invalid row(s)", icon="⚠️")
 
         except Exception as e:
             st.error(f"❌ Error processing file: {str(e)}")
@@ -864,34 +1030,26 @@ class Dashboard:
 
             # Preview zone
             if uploaded_file is not None:
-                st.markdown('<div class="glass slide-up">', unsafe_allow_html=True)
                 st.subheader("👀 Preview")
                 try:
-                    uploaded_file.seek(0)
-                    preview_df = pd.read_csv(uploaded_file)
-                except Exception:
-                    uploaded_file.seek(0)
-                    preview_df = pd.read_excel(uploaded_file)
-                st.dataframe(preview_df.head(), use_container_width=True, height=240)
-                st.caption(f"Rows detected: {len(preview_df)}")
-                st.markdown("</div>", unsafe_allow_html=True)
+                    if self._is_chunked(uploaded_file):
+                        preview_df, approx_rows = self._peek_upload(uploaded_file)
+                        rows_caption = f"Rows detected: ~{approx_rows:,} (large file, exact count on import)"
+                    else:
+                        preview_df = self._parse_upload(uploaded_file)
+                        rows_caption = f"Rows detected: {len(preview_df)}"
+                    st.dataframe(preview_df.head(), use_container_width=True, height=240)
+                    st.caption(rows_caption)
+                except Exception as e:
+                    st.error(f"❌ Could not preview file: {str(e)}")
 
         # Appearance
         with tab2:
             st.subheader("🎛️ Theme")
-            current = st.session_state.theme
-            choice = st.radio(
-                "🌈 Color Mode",
-                ["light", "dark"],
-                index=(0 if current == "light" else 1),
-                format_func=lambda x: "🌞 Light" if x == "light" else "🌙 Dark",
-                horizontal=True,
+            st.caption(
+                "Use the sun/moon button in the top-right corner. The choice is saved in this "
+                "browser; without one, the theme follows your system setting."
             )
-            if choice != current:
-                st.session_state.theme = choice
-                self._inject_css()
-                st.success(f"Theme changed to {choice}.")
-                st.experimental_rerun()
 
             st.markdown("---")
             st.subheader("🔔 Notifications (UI Only)")
@@ -913,6 +1071,7 @@ class Dashboard:
                 if st.button("🎲 Load Sample Data", use_container_width=True):
                     try:
                         self.billing.load_sample_data()
+                        clear_analytics_cache()
                         st.success("✅ Sample data loaded successfully!")
                         st.balloons()
                     except Exception as e:
@@ -933,6 +1092,8 @@ class Dashboard:
 
     # ------------------------------- Entrypoint ------------------------------ #
     def run(self) -> None:
+        self.prepare_session()
+
         # Sidebar navigation (kept simple and predictable)
         st.sidebar.title("Ledgerly")
         page = st.sidebar.radio("Navigate", ["Dashboard", "Sales", "Inventory", "Expenses", "Reports", "Settings"])
@@ -5,8 +5,8 @@ from ledgerly.models.sales_model import Base
 class Expense(Base):
     __tablename__ = "expenses"
     id = Column(Integer, primary_key=True)
-    category = Column(String, nullable=False)
+    category = Column(String, nullable=False, index=True)
     vendor = Column(String)
     amount = Column(Float, nullable=False)
-    date = Column(Date, nullable=False)
+    date = Column(Date, nullable=False, index=True)
     notes = Column(Text)
@@ -7,5 +7,5 @@ class Receivable(Base):
     id = Column(Integer, primary_key=True)
     customer = Column(String, nullable=False)
     amount = Column(Float, nullable=False)
-    due_date = Column(Date, nullable=False)
-    status = Column(String, default="pending")
+    due_date = Column(Date, nullable=False, index=True)
+    status = Column(String, default="pending", index=True)
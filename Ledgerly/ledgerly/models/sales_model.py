@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Float, Date
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, Integer, String, Float, Date, Index
+from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
 
@@ -7,9 +7,12 @@ Base = declarative_base()
 class Sale(Base):
     __tablename__ = "sales"
     id = Column(Integer, primary_key=True)
-    item = Column(String, nullable=False)
+    item = Column(String, nullable=False, index=True)
     qty = Column(Float, nullable=False)
     unit_price = Column(Float, nullable=False)
     total = Column(Float, nullable=False)
     customer = Column(String)
     date = Column(Date, nullable=False)
+
+    # Leading on date, this also serves the per-day and per-month filters
+    __table_args__ = (Index("ix_sale_date_item", "date", "item"),)
@@ -1,81 +1,120 @@
 
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import func
+import streamlit as st
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select
 from ledgerly.models.sales_model import Sale
 from ledgerly.models.expenses_model import Expense
 from ledgerly.models.receivables_model import Receivable
 from ledgerly.utils.db import get_engine
 from ledgerly.utils.helpers import parse_date
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import timedelta
+
+# Query results are memoized across Streamlit reruns for _CACHE_TTL seconds.
+# Each cached query takes the engine (hashed by its URL) and, where the result
+# depends on the day, today's date so the cache rolls over at midnight.
+# The Dashboard clears the cache after every committed write.
+_CACHE_TTL = 60
+_cached = st.cache_data(ttl=_CACHE_TTL, show_spinner=False, hash_funcs={Engine: lambda e: str(e.url)})
+
+
+@_cached
+def _todays_totals(engine, today):
+    # Both sums as scalar subqueries of one SELECT: a single round-trip
+    session = Session(engine)
+    try:
+        row = session.execute(select(
+            func.coalesce(select(func.sum(Sale.total)).where(Sale.date == today).scalar_subquery(), 0.0),
+            func.coalesce(select(func.sum(Expense.amount)).where(Expense.date == today).scalar_subquery(), 0.0),
+        )).one()
+        return float(row[0]), float(row[1])
+    finally:
+        session.close()
+
+
+@_cached
+def _pending_receivables(engine):
+    session = Session(engine)
+    try:
+        # Only the three displayed columns, as plain rows rather than ORM instances
+        stmt = select(Receivable.customer, Receivable.amount, Receivable.due_date).where(Receivable.status == "pending")
+        return [tuple(r) for r in session.execute(stmt)]
+    finally:
+        session.close()
+
+
+# The DataFrame-returning queries go through pd.read_sql on Core selects,
+# which fills the columns straight from the cursor without ORM row objects
+@_cached
+def _top_items(engine):
+    stmt = select(Sale.item, func.sum(Sale.qty).label('qty')).group_by(Sale.item).order_by(func.sum(Sale.qty).desc()).limit(5)
+    return pd.read_sql(stmt, engine)
+
+
+@_cached
+def _monthly_trend(engine, data_type):
+    if data_type == "sales":
+        stmt = select(Sale.date, func.sum(Sale.total).label('total')).group_by(Sale.date).order_by(Sale.date)
+    else:
+        stmt = select(Expense.date, func.sum(Expense.amount).label('total')).group_by(Expense.date).order_by(Expense.date)
+    return pd.read_sql(stmt, engine, parse_dates=['date'])
+
+
+@_cached
+def _expense_breakdown(engine):
+    stmt = select(Expense.category, func.sum(Expense.amount).label('amount')).group_by(Expense.category)
+    return pd.read_sql(stmt, engine)
+
+
+@_cached
+def _sales_forecast(engine, today):
+    # Simple 7-day forecast based on recent average
+    session = Session(engine)
+    try:
+        seven_days_ago = today - timedelta(days=7)
+        result = session.query(func.avg(Sale.total)).filter(Sale.date >= seven_days_ago).scalar()
+        return (result or 0.0) * 7
+    finally:
+        session.close()
+
+
+def clear_analytics_cache():
+    """Drop memoized analytics so the next read sees fresh data"""
+    for fn in (_todays_totals, _pending_receivables, _top_items,
+               _monthly_trend, _expense_breakdown, _sales_forecast):
+        fn.clear()
+
 
 class AnalyticsService:
     def __init__(self):
         self.engine = get_engine()
-        self.Session = sessionmaker(bind=self.engine)
+
+    def get_todays_totals(self):
+        """Return today's (sales, expenses) totals"""
+        return _todays_totals(self.engine, parse_date("today"))
 
     def get_todays_sales(self):
-        session = self.Session()
-        try:
-            today = parse_date("today")
-            result = session.query(func.sum(Sale.total)).filter(Sale.date == today).scalar()
-            return result or 0.0
-        finally:
-            session.close()
+        return self.get_todays_totals()[0]
 
     def get_todays_expenses(self):
-        session = self.Session()
-        try:
-            today = parse_date("today")
-            result = session.query(func.sum(Expense.amount)).filter(Expense.date == today).scalar()
-            return result or 0.0
-        finally:
-            session.close()
+        return self.get_todays_totals()[1]
 
     def get_net_profit(self):
-        return self.get_todays_sales() - self.get_todays_expenses()
+        sales, expenses = self.get_todays_totals()
+        return sales - expenses
 
     def get_pending_receivables(self):
-        session = self.Session()
-        try:
-            receivables = session.query(Receivable).filter(Receivable.status == "pending").all()
-            return [(r.customer, r.amount, r.due_date) for r in receivables]
-        finally:
-            session.close()
+        return _pending_receivables(self.engine)
 
     def get_top_items(self):
-        session = self.Session()
-        try:
-            result = session.query(Sale.item, func.sum(Sale.qty).label('qty')).group_by(Sale.item).order_by(func.sum(Sale.qty).desc()).limit(5).all()
-            return pd.DataFrame(result, columns=['item', 'qty'])
-        finally:
-            session.close()
+        return _top_items(self.engine)
 
     def get_monthly_trend(self, data_type="sales"):
-        session = self.Session()
-        try:
-            if data_type == "sales":
-                result = session.query(Sale.date, func.sum(Sale.total).label('total')).group_by(Sale.date).order_by(Sale.date).all()
-            else:
-                result = session.query(Expense.date, func.sum(Expense.amount).label('total')).group_by(Expense.date).order_by(Expense.date).all()
-            return pd.DataFrame(result, columns=['date', 'total'])
-        finally:
-            session.close()
+        return _monthly_trend(self.engine, data_type)
 
     def get_expense_breakdown(self):
-        session = self.Session()
-        try:
-            result = session.query(Expense.category, func.sum(Expense.amount).label('amount')).group_by(Expense.category).all()
-            return pd.DataFrame(result, columns=['category', 'amount'])
-        finally:
-            session.close()
+        return _expense_breakdown(self.engine)
 
     def get_sales_forecast(self):
-        # Simple 7-day forecast based on recent average
-        session = self.Session()
-        try:
-            seven_days_ago = parse_date("today") - timedelta(days=7)
-            result = session.query(func.avg(Sale.total)).filter(Sale.date >= seven_days_ago).scalar()
-            return (result or 0.0) * 7
-        finally:
-            session.close()
+        return _sales_forecast(self.engine, parse_date("today"))
@@ -1,29 +1,29 @@
 
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from collections import Counter
+from sqlalchemy import bindparam, insert, tuple_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from ledgerly.models.sales_model import Sale
 from ledgerly.models.expenses_model import Expense
-from ledgerly.models.receivables_model import Receivable
 from ledgerly.models.stock_model import Stock
-from ledgerly.utils.db import get_engine
+from ledgerly.utils.db import get_engine, get_sessionmaker
 from ledgerly.utils.helpers import parse_date
-import pandas as pd
 
 class BillingService:
     def __init__(self):
         self.engine = get_engine()
-        self.Session = sessionmaker(bind=self.engine)
+        self.Session = get_sessionmaker()
 
     def add_sale(self, item, qty, unit_price, total, customer):
         session = self.Session()
         try:
-            sale = Sale(item=item, qty=qty, unit_price=unit_price, total=total, customer=customer, date=parse_date("today"))
+            today = parse_date("today")  # once, so the sale and stock dates agree
+            sale = Sale(item=item, qty=qty, unit_price=unit_price, total=total, customer=customer, date=today)
             session.add(sale)
             # Update stock
             stock = session.query(Stock).filter_by(item=item).first()
             if stock:
                 stock.qty -= qty
-                stock.last_updated = parse_date("today")
+                stock.last_updated = today
             session.commit()
             return sale.id
         except Exception as e:
@@ -75,6 +75,91 @@ class BillingService:
         finally:
             session.close()
 
+    def add_sales_bulk(self, rows):
+        """Insert sale dicts (item, qty, unit_price, customer[, total, date]) in one transaction
+
+        Stock is decremented with a single executemany UPDATE per batch rather
+        than a SELECT per row.
+        """
+        session = self.Session()
+        try:
+            today = parse_date("today")
+            # New dicts with the defaults filled in; the caller's rows stay untouched.
+            # Normalized imports already carry total, so it is only computed when missing
+            rows = [
+                {"date": today, **r} if "total" in r else {"total": r["qty"] * r["unit_price"], "date": today, **r}
+                for r in rows
+            ]
+            sold = Counter()
+            for r in rows:
+                sold[r["item"]] += r["qty"]
+            if rows:
+                # Core executemany: one compiled INSERT, no ORM instances
+                session.execute(insert(Sale.__table__), rows)
+            if sold:
+                session.execute(
+                    update(Stock.__table__)
+                    .where(Stock.item == bindparam("i"))
+                    .values(qty=Stock.qty - bindparam("d"), last_updated=today),
+                    [{"i": item, "d": qty} for item, qty in sold.items()],
+                )
+            session.commit()
+            return len(rows)
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def add_expenses_bulk(self, rows):
+        """Insert expense dicts (category, vendor, amount, notes[, date]) in one transaction"""
+        session = self.Session()
+        try:
+            today = parse_date("today")
+            # New dicts with the date filled in; the caller's rows stay untouched
+            rows = [{"date": today, **r} for r in rows]
+            if rows:
+                session.execute(insert(Expense.__table__), rows)
+            session.commit()
+            return len(rows)
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def add_stock_bulk(self, rows):
+        """Add or update stock dicts (item, qty, threshold, unit_cost) in one transaction"""
+        session = self.Session()
+        try:
+            today = parse_date("today")
+            latest = {r["item"]: r for r in rows}  # last row per item wins
+            self._upsert_stock(session, [{**r, "last_updated": today} for r in latest.values()])
+            session.commit()
+            return len(latest)
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    @staticmethod
+    def _upsert_stock(session, rows):
+        """Insert stock rows, overwriting existing items, as one INSERT ... ON CONFLICT(item) DO UPDATE"""
+        if not rows:
+            return
+        stmt = sqlite_insert(Stock.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Stock.item],
+            set_={
+                "qty": stmt.excluded.qty,
+                "threshold": stmt.excluded.threshold,
+                "unit_cost": stmt.excluded.unit_cost,
+                "last_updated": stmt.excluded.last_updated,
+            },
+        )
+        session.execute(stmt, rows)
+
     def load_sample_data(self):
         session = self.Session()
         try:
@@ -85,34 +170,28 @@ class BillingService:
                 {"item": "Tea", "qty": 5, "unit_price": 10, "total": 50, "customer": "Bob", "date": "2025-01-16"},
             ]
             
-            for data in sample_sales:
-                existing_sale = session.query(Sale).filter_by(
-                    item=data["item"], 
-                    customer=data["customer"], 
-                    date=parse_date(data["date"])
-                ).first()
-                if not existing_sale:
-                    sale = Sale(**{**data, "date": parse_date(data["date"])})
-                    session.add(sale)
+            # One IN query for the sample sales already present
+            sample_sales = [{**data, "date": parse_date(data["date"])} for data in sample_sales]
+            keys = [(data["item"], data["customer"], data["date"]) for data in sample_sales]
+            existing_sales = set(
+                session.query(Sale.item, Sale.customer, Sale.date)
+                .filter(tuple_(Sale.item, Sale.customer, Sale.date).in_(keys))
+                .all()
+            )
+            new_sales = [data for data, key in zip(sample_sales, keys) if key not in existing_sales]
+            # Plain INSERT, no stock decrement: stock is set to absolute sample levels below
+            if new_sales:
+                session.execute(insert(Sale.__table__), new_sales)
             
             # Sample stock data
+            stock_date = parse_date("2025-01-15")
             stock_data = [
-                {"item": "Sugar", "qty": 100, "threshold": 10, "unit_cost": 40, "last_updated": parse_date("2025-01-15")},
-                {"item": "Rice", "qty": 50, "threshold": 5, "unit_cost": 60, "last_updated": parse_date("2025-01-15")},
-                {"item": "Tea", "qty": 200, "threshold": 20, "unit_cost": 8, "last_updated": parse_date("2025-01-15")},
+                {"item": "Sugar", "qty": 100, "threshold": 10, "unit_cost": 40, "last_updated": stock_date},
+                {"item": "Rice", "qty": 50, "threshold": 5, "unit_cost": 60, "last_updated": stock_date},
+                {"item": "Tea", "qty": 200, "threshold": 20, "unit_cost": 8, "last_updated": stock_date},
             ]
-            for data in stock_data:
-                existing_stock = session.query(Stock).filter_by(item=data["item"]).first()
-                if existing_stock:
-                    # Update existing stock
-                    existing_stock.qty = data["qty"]
-                    existing_stock.threshold = data["threshold"]
-                    existing_stock.unit_cost = data["unit_cost"]
-                    existing_stock.last_updated = data["last_updated"]
-                else:
-                    # Add new stock
-                    stock = Stock(**data)
-                    session.add(stock)
+            # Add new stock, update existing
+            self._upsert_stock(session, stock_data)
             session.commit()
         except Exception as e:
             session.rollback()
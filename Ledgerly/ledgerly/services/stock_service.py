@@ -1,24 +1,31 @@
 
-from sqlalchemy.orm import sessionmaker
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, select
 from ledgerly.models.stock_model import Stock
-from ledgerly.utils.db import get_engine
+from ledgerly.utils.db import get_engine, get_sessionmaker
 from ledgerly.utils.helpers import parse_date
 
+def _format_numbers(s):
+    """Whole numbers without the trailing ".0", anything else as str() gives it"""
+    v = s.to_numpy(dtype=float)
+    out = v.astype(str).astype(object)  # object, so longer int strings aren't truncated
+    # Only whole values inside int64's range are cast; larger ones keep str()
+    whole = (v % 1 == 0) & (np.abs(v) < 2.0 ** 63)
+    out[whole] = v[whole].astype("int64").astype(str)
+    return pd.Series(out, index=s.index)
+
 class StockService:
     def __init__(self):
         self.engine = get_engine()
-        self.Session = sessionmaker(bind=self.engine)
+        self.Session = get_sessionmaker()
 
     def get_stock(self):
-        """Get all stock items"""
-        session = self.Session()
-        try:
-            stocks = session.query(Stock).all()
-            return [[stock.item, stock.qty, stock.threshold, stock.unit_cost] for stock in stocks]
-        except Exception as e:
-            raise e
-        finally:
-            session.close()
+        """Get all stock items as (item, qty, threshold, unit_cost) tuples"""
+        # Core select: plain rows, no ORM instances to build
+        stmt = select(Stock.item, Stock.qty, Stock.threshold, Stock.unit_cost)
+        with self.engine.connect() as conn:
+            return [tuple(row) for row in conn.execute(stmt)]
 
     def update_stock(self, item, qty, threshold, unit_cost):
         """Update or add stock item"""
@@ -46,58 +53,22 @@ class StockService:
         finally:
             session.close()
 
-    def get_low_stock_alerts(self):
-        """Get items with low stock"""
-        session = self.Session()
-        try:
-            low_stock_items = session.query(Stock).filter(Stock.qty <= Stock.threshold).all()
-            alerts = []
-            for item in low_stock_items:
-                alerts.append(f"⚠️ {item.item}: Only {item.qty} left (threshold: {item.threshold})")
-            return alerts
-        except Exception as e:
-            return [f"Error loading stock alerts: {str(e)}"]
-        finally:
-            session.close()
-
-class StockService:
-    def __init__(self):
-        self.engine = get_engine()
-        self.Session = sessionmaker(bind=self.engine)
-
-    def update_stock(self, item, qty, threshold, unit_cost):
-        session = self.Session()
-        try:
-            stock = session.query(Stock).filter_by(item=item).first()
-            if stock:
-                stock.qty = qty
-                stock.threshold = threshold
-                stock.unit_cost = unit_cost
-                stock.last_updated = parse_date("today")
-            else:
-                stock = Stock(item=item, qty=qty, threshold=threshold, unit_cost=unit_cost, last_updated=parse_date("today"))
-                session.add(stock)
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            session.close()
-
-    def get_stock(self):
+    def count(self):
+        """Get the number of stock items"""
         session = self.Session()
         try:
-            return [(s.item, s.qty, s.threshold, s.unit_cost) for s in session.query(Stock).all()]
+            return session.query(func.count(Stock.id)).scalar() or 0
         finally:
             session.close()
 
     def get_low_stock_alerts(self):
-        session = self.Session()
+        """Get items with low stock"""
         try:
-            alerts = []
-            for stock in session.query(Stock).all():
-                if stock.qty <= stock.threshold:
-                    alerts.append(f"{stock.item}: {stock.qty} left; threshold {stock.threshold}")
-            return alerts
-        finally:
-            session.close()
+            # Filter in SQL, then build every message with column-wise string ops
+            stmt = select(Stock.item, Stock.qty, Stock.threshold).where(Stock.qty <= Stock.threshold)
+            df = pd.read_sql(stmt, self.engine)
+            qty = _format_numbers(df["qty"])
+            threshold = _format_numbers(df["threshold"])
+            return (df["item"] + ": " + qty + " left; threshold " + threshold).tolist()
+        except Exception as e:
+            return [f"Error loading stock alerts: {str(e)}"]
@@ -0,0 +1,47 @@
+import re
+from app import STATIC_DIR, THEME_TOGGLE_JS, load_css
+from ui_utils import minify_css
+
+def test_load_css_inlines_theme():
+    # Streamlit's static server sends .css as text/plain + nosniff, which
+    # browsers drop: the theme must arrive as <style>, never a static link
+    head = load_css()
+    assert "/app/static/" not in head
+    for path in STATIC_DIR.glob("*.css"):
+        assert f'<style id="ledgerly-{path.stem}"' in head
+        assert minify_css(path.read_text(encoding="utf-8")) in head
+    assert re.search(r'<style id="ledgerly-theme-dark" media="\(prefers-color-scheme: dark\)">', head)
+    assert 'getElementById("ledgerly-theme-dark")' in THEME_TOGGLE_JS
+
+def test_dashboard_run_standalone():
+    from streamlit.testing.v1 import AppTest
+
+    def script():
+        from dashboard import Dashboard
+        Dashboard().run()
+
+    at = AppTest.from_function(script, default_timeout=60).run()
+    assert not at.exception
+
+def test_dashboard_css_leaves_theme_to_shell():
+    # The dashboard sheet is appended after the shell's, so any theme variable
+    # it redefined would pin that colour regardless of the shell toggle
+    from dashboard import _CSS
+
+    shell_vars = re.findall(r"(--[\w-]+):", (STATIC_DIR / "theme-light.css").read_text(encoding="utf-8"))
+    assert {"--text-primary", "--card-bg"} <= set(shell_vars)
+    for var in shell_vars:
+        assert f"{var}:" not in _CSS
+
+def test_trend_downsample_keeps_exact_dates():
+    import numpy as np
+    import pandas as pd
+    from dashboard import _TREND_MAX_POINTS, _lttb
+
+    dates = pd.date_range("2024-01-01", periods=3 * _TREND_MAX_POINTS, freq="D").to_numpy()
+    totals = np.sin(np.arange(len(dates)) / 20.0)
+    keep = _lttb(dates.astype(np.int64), totals, _TREND_MAX_POINTS)
+    assert len(keep) == _TREND_MAX_POINTS
+    assert keep[0] == 0 and keep[-1] == len(dates) - 1
+    # Indexing the original datetime64 array: every kept point is still midnight
+    assert (dates[keep] == dates[keep].astype("datetime64[D]")).all()
@@ -0,0 +1,14 @@
+from datetime import date
+import utils.helpers as helpers
+from utils.helpers import parse_date
+
+def test_today_recomputed_after_expiry():
+    helpers._TODAY = (0.0, date(2000, 1, 1))  # expired entry from a past day
+    assert parse_date("today") == date.today()
+
+def test_parse_date_keeps_strptime_semantics():
+    # Accepted by strptime("%Y-%m-%d") though not by fromisoformat
+    assert parse_date("2024-1-5") == date(2024, 1, 5)
+    # Accepted by fromisoformat but not by strptime: fall back to today
+    assert parse_date("20240105") == date.today()
+    assert parse_date("2024-W01-1") == date.today()
@@ -16,4 +16,32 @@ def test_add_sale_updates_stock(setup_db):
     sale_id = billing.add_sale("Sugar", 2, 50, 100, "John")
     stock_data = stock.get_stock()
     assert any(item == "Sugar" and qty == 8 for item, qty, _, _ in stock_data)
-    assert sale_id is not None
\ No newline at end of file
+    assert sale_id is not None
+
+def test_add_sales_bulk_updates_stock(setup_db):
+    billing = BillingService()
+    stock = StockService()
+    stock.update_stock("Sugar", 10, 5, 40)
+    rows = [
+        {"item": "Sugar", "qty": 2, "unit_price": 50, "customer": "John"},
+        {"item": "Sugar", "qty": 1, "unit_price": 50, "customer": ""},
+    ]
+    assert billing.add_sales_bulk(rows) == 2
+    assert "total" not in rows[0] and "date" not in rows[0]  # caller's dicts left as given
+    stock_data = stock.get_stock()
+    assert any(item == "Sugar" and qty == 7 for item, qty, _, _ in stock_data)
+
+def test_load_sample_data_twice_no_duplicates(setup_db):
+    from datetime import date
+    from models.sales_model import Sale
+    billing = BillingService()
+    billing.load_sample_data()
+    billing.load_sample_data()
+    session = billing.Session()
+    try:
+        count = session.query(Sale).filter_by(item="Sugar", customer="John", date=date(2025, 1, 15)).count()
+    finally:
+        session.close()
+    assert count == 1
+    stock_data = StockService().get_stock()
+    assert any(item == "Sugar" and qty == 100 for item, qty, _, _ in stock_data)
@@ -12,4 +12,33 @@ def test_low_stock_alert(setup_db):
     stock = StockService()
     stock.update_stock("Sugar", 5, 10, 40)
     alerts = stock.get_low_stock_alerts()
-    assert any("Sugar: 5 left; threshold 10" in alert for alert in alerts)
\ No newline at end of file
+    assert any("Sugar: 5 left; threshold 10" in alert for alert in alerts)
+
+def test_stock_count(setup_db):
+    stock = StockService()
+    stock.update_stock("Sugar", 5, 10, 40)
+    assert stock.count() == len(stock.get_stock())
+
+def test_low_stock_alert_large_and_fractional_qty(setup_db):
+    stock = StockService()
+    stock.update_stock("AlertBulk", 1234567, 2345678, 1)
+    stock.update_stock("AlertLoose", 2.5, 10, 1)
+    stock.update_stock("AlertHuge", 1e20, 1e21, 1)  # whole, but beyond int64
+    alerts = stock.get_low_stock_alerts()
+    assert "AlertBulk: 1234567 left; threshold 2345678" in alerts
+    assert "AlertLoose: 2.5 left; threshold 10" in alerts
+    assert "AlertHuge: 1e+20 left; threshold 1e+21" in alerts
+
+def test_add_stock_bulk_upserts(setup_db):
+    from services.billing_service import BillingService
+    stock = StockService()
+    stock.update_stock("BulkExisting", 5, 10, 40)
+    rows = [
+        {"item": "BulkExisting", "qty": 7, "threshold": 3, "unit_cost": 45},
+        {"item": "BulkDup", "qty": 1, "threshold": 1, "unit_cost": 1},
+        {"item": "BulkDup", "qty": 9, "threshold": 2, "unit_cost": 3},
+    ]
+    # Duplicate items in one batch collapse to the last row
+    assert BillingService().add_stock_bulk(rows) == 2
+    rows = [row for row in stock.get_stock() if row[0].startswith("Bulk")]
+    assert sorted(rows) == [("BulkDup", 9, 2, 3), ("BulkExisting", 7, 3, 45)]
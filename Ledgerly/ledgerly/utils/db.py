@@ -1,20 +1,56 @@
 
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
+from functools import lru_cache
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
 from ledgerly.models.sales_model import Base
 from ledgerly.models.expenses_model import Expense
 from ledgerly.models.receivables_model import Receivable
 from ledgerly.models.stock_model import Stock
 
+@lru_cache(maxsize=1)
 def get_engine():
-    """Get database engine"""
+    """Get the process-wide database engine (one connection pool for all services)"""
     from .config import DB_PATH
     # Ensure data directory exists
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    return create_engine(f"sqlite:///{DB_PATH}")
+    # query_cache_size keeps more compiled statements around, so repeated
+    # inserts and lookups skip SQL compilation
+    engine = create_engine(f"sqlite:///{DB_PATH}", query_cache_size=1200)
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _):
+        # WAL + synchronous=NORMAL fsyncs at checkpoints instead of on every
+        # commit, and lets readers run while a write is in progress
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA synchronous=NORMAL")
+        cur.execute("PRAGMA temp_store=MEMORY")
+        cur.execute("PRAGMA cache_size=-20000")
+        cur.execute("PRAGMA mmap_size=268435456")
+        cur.close()
+
+    return engine
+
+@lru_cache(maxsize=1)
+def get_sessionmaker():
+    """Get the shared session factory bound to get_engine()"""
+    return sessionmaker(bind=get_engine())
+
+# Database URLs already brought up in this process; later init_db calls skip
+# the schema checks entirely
+_DB_READY = set()
 
 def init_db(db_path):
-    """Initialize database with all tables"""
+    """Initialize database with all tables (once per process and database)"""
     engine = get_engine()
+    url = str(engine.url)
+    if url in _DB_READY:
+        return
     Base.metadata.create_all(engine)
+    # create_all skips tables that already exist, so indexes added to the
+    # models later would never reach an existing database file
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    _DB_READY.add(url)
@@ -1,18 +1,64 @@
 
-from datetime import datetime, date
+import time
+from datetime import datetime, date, timedelta
+from functools import lru_cache
 from .config import DATE_FORMAT, CURRENCY_SYMBOL
 
+# ISO dates parse with date.fromisoformat, far cheaper than strptime. It is
+# implemented in C (the _datetime module), so an optional ciso8601 wouldn't
+# be any faster for plain dates
+_ISO_DATE_FORMAT = DATE_FORMAT == "%Y-%m-%d"
+
+# Format spec held as a constant so each call needn't rebuild it
+_CURRENCY_SPEC = ",.2f"
+_CURRENCY_FMT = (CURRENCY_SYMBOL + "{:" + _CURRENCY_SPEC + "}").format
+
 def format_currency(amount):
-    """Format amount with currency symbol"""
-    return f"{CURRENCY_SYMBOL}{amount:,.2f}"
+    """Format amount with currency symbol (single labels; tables use format_currency_many)"""
+    return CURRENCY_SYMBOL + format(amount, _CURRENCY_SPEC)
+
+def format_currency_many(amounts):
+    """Format an iterable of amounts with currency symbol, as a list"""
+    return [_CURRENCY_FMT(a) for a in amounts]
+
+# (expiry timestamp, date): today's date, held until the next local midnight.
+# One tuple so threads always see a matching pair
+_TODAY = (0.0, None)
+
+def _today():
+    """Today's date, recomputed only once the local day has rolled over"""
+    global _TODAY
+    expires, today = _TODAY
+    if time.time() >= expires:
+        today = date.today()
+        midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        _TODAY = (midnight.timestamp(), today)
+    return today
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str):
+    """Parse a DATE_FORMAT string; raises ValueError (never cached) when it doesn't match"""
+    # Ledger rows repeat a handful of dates, so most calls are a dict hit
+    # Only the canonical YYYY-MM-DD shape takes the fast path: fromisoformat
+    # alone would reject "2024-1-5" and accept "20240105" or "2024-W01-1",
+    # unlike strptime, which stays the parser of record for everything else
+    if _ISO_DATE_FORMAT and len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
+    return datetime.strptime(date_str, DATE_FORMAT).date()
 
 def parse_date(date_str):
     """Parse date string or return today's date"""
+    # Dates handed back by the ORM are the common case: pass them through first
+    if isinstance(date_str, date):
+        return date_str
     if date_str == "today":
-        return date.today()
+        return _today()
     elif isinstance(date_str, str):
         try:
-            return datetime.strptime(date_str, DATE_FORMAT).date()
+            return _parse_date_cached(date_str)
         except ValueError:
-            return date.today()
+            return _today()
     return date_str
@@ -1,91 +1,127 @@
 
 import streamlit as st
-from streamlit_option_menu import option_menu
-from dashboard import Dashboard
 from ledgerly.utils.db import init_db
 from ledgerly.utils.config import DB_PATH
 
+# Sidebar content, built once at import rather than on every rerun
+_SIDEBAR_HEADER_HTML = """
+    <div style="text-align: center; margin-bottom: 30px;">
+        <h1 style="color: var(--primary-color); margin-bottom: 5px;">📊 Ledgerly</h1>
+        <p style="color: var(--text-secondary); font-size: 14px;">Business Management Suite</p>
+    </div>
+"""
+
+_NAV_OPTIONS = [
+    "Dashboard", 
+    "Sales", 
+    "Expenses", 
+    "Inventory", 
+    "Reports", 
+    "Settings"
+]
+
+_NAV_ICONS = [
+    "house-fill", 
+    "cart-plus-fill", 
+    "credit-card-fill", 
+    "box-seam-fill", 
+    "graph-up", 
+    "gear-fill"
+]
+
+_SIDEBAR_STYLES = {
+    "container": {
+        "padding": "0!important",
+        "background-color": "transparent"
+    },
+    "icon": {
+        "color": "var(--text-secondary)", 
+        "font-size": "18px"
+    },
+    "nav-link": {
+        "font-size": "16px",
+        "text-align": "left",
+        "margin": "5px 0",
+        "padding": "10px 15px",
+        "border-radius": "8px",
+        "color": "var(--text-primary)",
+        "background-color": "transparent",
+        "transition": "all 0.3s ease"
+    },
+    "nav-link-selected": {
+        "background": "linear-gradient(135deg, var(--primary-color), var(--secondary-color))",
+        "color": "white",
+        "box-shadow": "0 2px 4px rgba(0, 0, 0, 0.1)"
+    },
+}
+
+# Page name -> Dashboard method; looked up per rerun, nothing is rebuilt
+_ROUTES = {
+    "Dashboard": "show_dashboard",
+    "Sales": "show_sales",
+    "Expenses": "show_expenses",
+    "Inventory": "show_inventory",
+    "Reports": "show_reports",
+    "Settings": "show_settings",
+}
+
+@st.cache_resource
+def get_dashboard():
+    """Initialize the database and build the Dashboard once per process"""
+    # Imported on first use: dashboard pulls in pandas, NumPy and pyarrow
+    from dashboard import Dashboard
+
+    init_db(DB_PATH)  # Initialize database on startup
+    return Dashboard()
+
 class LedgerlyApp:
+    __slots__ = ("dashboard",)
+
     def __init__(self):
         try:
-            init_db(DB_PATH)  # Initialize database on startup
-            self.dashboard = Dashboard()
+            # Cached: reruns skip DB bring-up; a failure isn't cached and is retried
+            self.dashboard = get_dashboard()
         except Exception as e:
             st.error(f"❌ Database initialization error: {str(e)}")
             st.stop()
 
-    def run(self):
+    @staticmethod
+    def _show_page(handler):
+        """Run a page handler so its errors are reported on that page and the run completes"""
+        try:
+            handler()
+        except Exception as e:
+            # st.stop()/st.rerun() raise BaseException subclasses and pass through
+            st.error(f"❌ An error occurred: {str(e)}")
+            st.info("🔄 Please refresh the page or contact support if the issue persists.")
+
+    def run(self, container=None):
+        """Render the app, optionally into a placeholder container."""
+        if container is None:
+            return self._render()
+        with container:
+            self._render()
+
+    def _render(self):
+        self.dashboard.prepare_session()
+
+        # Imported here like Dashboard, so app.py's shell goes out before it loads
+        from streamlit_option_menu import option_menu
+
         # Sidebar navigation with icons
         with st.sidebar:
-            st.markdown("""
-                <div style="text-align: center; margin-bottom: 30px;">
-                    <h1 style="color: var(--primary-color); margin-bottom: 5px;">📊 Ledgerly</h1>
-                    <p style="color: var(--text-secondary); font-size: 14px;">Business Management Suite</p>
-                </div>
-            """, unsafe_allow_html=True)
-            
+            st.markdown(_SIDEBAR_HEADER_HTML, unsafe_allow_html=True)
             page = option_menu(
                 menu_title=None,
-                options=[
-                    "Dashboard", 
-                    "Sales", 
-                    "Expenses", 
-                    "Inventory", 
-                    "Reports", 
-                    "Settings"
-                ],
-                icons=[
-                    "house-fill", 
-                    "cart-plus-fill", 
-                    "credit-card-fill", 
-                    "box-seam-fill", 
-                    "graph-up", 
-                    "gear-fill"
-                ],
+                options=_NAV_OPTIONS,
+                icons=_NAV_ICONS,
                 menu_icon="cast",
                 default_index=0,
                 orientation="vertical",
-                styles={
-                    "container": {
-                        "padding": "0!important",
-                        "background-color": "transparent"
-                    },
-                    "icon": {
-                        "color": "var(--text-secondary)", 
-                        "font-size": "18px"
-                    },
-                    "nav-link": {
-                        "font-size": "16px",
-                        "text-align": "left",
-                        "margin": "5px 0",
-                        "padding": "10px 15px",
-                        "border-radius": "8px",
-                        "color": "var(--text-primary)",
-                        "background-color": "transparent",
-                        "transition": "all 0.3s ease"
-                    },
-                    "nav-link-selected": {
-                        "background": "linear-gradient(135deg, var(--primary-color), var(--secondary-color))",
-                        "color": "white",
-                        "box-shadow": "0 2px 4px rgba(0, 0, 0, 0.1)"
-                    },
-                }
+                styles=_SIDEBAR_STYLES,
             )
         
-        # Route to appropriate page
-        try:
-            if page == "Dashboard":
-                self.dashboard.show_dashboard()
-            elif page == "Sales":
-                self.dashboard.show_sales()
-            elif page == "Expenses":
-                self.dashboard.show_expenses()
-            elif page == "Inventory":
-                self.dashboard.show_inventory()
-            elif page == "Reports":
-                self.dashboard.show_reports()
-            elif page == "Settings":
-                self.dashboard.show_settings()
-        except Exception as e:
-            st.error(f"❌ An error occurred: {str(e)}")
-            st.info("🔄 Please refresh the page or contact support if the issue persists.")
+        # Route to appropriate page, each inside its own error boundary
+        method = _ROUTES.get(page)
+        if method:
+            self._show_page(getattr(self.dashboard, method))